@@ -0,0 +1,30 @@
+"""Add covering index for the video library list query
+
+Revision ID: 023
+Revises: 022
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "023"
+down_revision = "022"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves WHERE user_id = ? AND is_deleted = false [AND status = ?]
+    # ORDER BY created_at DESC LIMIT n without a sort step
+    op.create_index(
+        "ix_videos_user_active_created",
+        "videos",
+        ["user_id", sa.text("created_at DESC")],
+        unique=False,
+        postgresql_include=["status", "content_type"],
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+    op.execute("ANALYZE videos")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_videos_user_active_created", table_name="videos")
@@ -0,0 +1,52 @@
+"""Persist transcript and chunk storage sizes on videos
+
+Revision ID: 024
+Revises: 023
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "024"
+down_revision = "023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "videos", sa.Column("transcript_bytes", sa.BigInteger(), nullable=True)
+    )
+    op.add_column("videos", sa.Column("chunk_bytes", sa.BigInteger(), nullable=True))
+
+    # Backfill from existing rows (transcript files on disk are picked up the
+    # next time a video is reprocessed)
+    op.execute(
+        """
+        UPDATE videos v
+        SET transcript_bytes = octet_length(t.full_text)
+        FROM transcripts t
+        WHERE t.video_id = v.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE videos v
+        SET chunk_bytes = s.chunk_bytes
+        FROM (
+            SELECT video_id,
+                   SUM(
+                       COALESCE(octet_length(text), 0)
+                       + COALESCE(octet_length(chunk_summary), 0)
+                       + COALESCE(octet_length(embedding_text), 0)
+                   ) AS chunk_bytes
+            FROM chunks
+            GROUP BY video_id
+        ) s
+        WHERE s.video_id = v.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("videos", "chunk_bytes")
+    op.drop_column("videos", "transcript_bytes")
@@ -0,0 +1,33 @@
+"""Add precomputed text_bytes to chunks
+
+Revision ID: 025
+Revises: 024
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "025"
+down_revision = "024"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "chunks",
+        sa.Column("text_bytes", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        UPDATE chunks
+        SET text_bytes = COALESCE(octet_length(text), 0)
+                       + COALESCE(octet_length(chunk_summary), 0)
+                       + COALESCE(octet_length(embedding_text), 0)
+        """
+    )
+    # Per-video sums stay index-only via idx_chunk_video_index's INCLUDE (026)
+    op.execute("ANALYZE chunks")
+
+
+def downgrade() -> None:
+    op.drop_column("chunks", "text_bytes")
@@ -0,0 +1,38 @@
+"""Add timestamp/title columns to the chunk (video_id, chunk_index) index
+
+Revision ID: 026
+Revises: 025
+"""
+from alembic import op
+
+revision = "026"
+down_revision = "025"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-video chunk listings read start/end timestamps and titles, and storage
+    # refreshes sum text_bytes; INCLUDE lets Postgres answer both with an
+    # index-only scan without a separate video_id index for each
+    op.drop_index("idx_chunk_video_index", table_name="chunks")
+    op.create_index(
+        "idx_chunk_video_index",
+        "chunks",
+        ["video_id", "chunk_index"],
+        unique=False,
+        postgresql_include=[
+            "start_timestamp",
+            "end_timestamp",
+            "chunk_title",
+            "text_bytes",
+        ],
+    )
+    op.execute("ANALYZE chunks")
+
+
+def downgrade() -> None:
+    op.drop_index("idx_chunk_video_index", table_name="chunks")
+    op.create_index(
+        "idx_chunk_video_index", "chunks", ["video_id", "chunk_index"], unique=False
+    )
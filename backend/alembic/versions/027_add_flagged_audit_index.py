@@ -0,0 +1,27 @@
+"""Add partial index for flagged admin audit events
+
+Revision ID: 027
+Revises: 026
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "027"
+down_revision = "026"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves WHERE cardinality(flags) > 0 ORDER BY created_at DESC LIMIT n
+    op.create_index(
+        "idx_audit_flagged_created",
+        "admin_audit_logs",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("cardinality(flags) > 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_audit_flagged_created", table_name="admin_audit_logs")
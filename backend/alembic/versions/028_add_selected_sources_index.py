@@ -0,0 +1,28 @@
+"""Add partial index for selected conversation sources
+
+Revision ID: 028
+Revises: 027
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "028"
+down_revision = "027"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves WHERE conversation_id = ? AND is_selected, and the per-conversation
+    # array_agg of selected video IDs in the conversation list, index-only
+    op.create_index(
+        "idx_conv_sources_selected",
+        "conversation_sources",
+        ["conversation_id", "video_id"],
+        unique=False,
+        postgresql_where=sa.text("is_selected"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_conv_sources_selected", table_name="conversation_sources")
@@ -0,0 +1,32 @@
+"""Index foreign key columns that had no index
+
+Revision ID: 029
+Revises: 028
+"""
+from alembic import op
+
+revision = "029"
+down_revision = "028"
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs whose referenced rows get deleted. Without an index
+# every parent delete runs a sequential scan for the ON DELETE action, e.g.
+# deleting a conversation scans llm_usage_events once per message.
+_FK_COLUMNS = [
+    ("collection_videos", "added_by_user_id"),
+    ("collection_members", "added_by_user_id"),
+    ("llm_usage_events", "message_id"),
+    ("notification_deliveries", "notification_id"),
+    ("discovered_content", "discovery_source_id"),
+]
+
+
+def upgrade() -> None:
+    for table, column in _FK_COLUMNS:
+        op.create_index(f"ix_{table}_{column}", table, [column], unique=False)
+
+
+def downgrade() -> None:
+    for table, column in reversed(_FK_COLUMNS):
+        op.drop_index(f"ix_{table}_{column}", table_name=table)
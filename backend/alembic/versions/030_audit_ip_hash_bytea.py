@@ -0,0 +1,26 @@
+"""Store admin audit ip_hash as raw digest bytes
+
+Revision ID: 030
+Revises: 029
+"""
+from alembic import op
+
+revision = "030"
+down_revision = "029"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 64-char hex string -> 32-byte SHA-256 digest
+    op.execute(
+        "ALTER TABLE admin_audit_logs "
+        "ALTER COLUMN ip_hash TYPE bytea USING decode(ip_hash, 'hex')"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE admin_audit_logs "
+        "ALTER COLUMN ip_hash TYPE varchar(128) USING encode(ip_hash, 'hex')"
+    )
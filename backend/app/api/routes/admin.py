@@ -937,9 +937,17 @@ async def recalculate_quotas(
 
     quotas = quota_query.all()
 
+    # Prime user emails in one query instead of one lookup per quota
+    email_by_user_id = {}
+    if quotas:
+        email_by_user_id = dict(
+            db.query(User.id, User.email)
+            .filter(User.id.in_([quota.user_id for quota in quotas]))
+            .all()
+        )
+
     for quota in quotas:
-        user = db.query(User).filter(User.id == quota.user_id).first()
-        user_email = user.email if user else str(quota.user_id)
+        user_email = email_by_user_id.get(quota.user_id) or str(quota.user_id)
 
         # Recalculate comprehensive storage (disk + database + vectors)
         calculator = StorageCalculator(db)
@@ -1216,7 +1224,7 @@ async def list_audit_messages(
                 output_tokens=log.output_tokens,
                 flags=log.flags or [],
                 created_at=log.created_at,
-                ip_hash=log.ip_hash,
+                ip_hash=log.ip_hash.hex() if log.ip_hash else None,
                 user_agent=log.user_agent,
                 metadata=log.message_metadata or {},
             )
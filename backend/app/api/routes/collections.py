@@ -14,7 +14,7 @@ import logging
 import uuid
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from sqlalchemy import func
 
 from app.core.nextauth import get_current_user
@@ -99,9 +99,13 @@ async def list_collections(
     Returns:
         CollectionList with collections and total count
     """
-    query = db.query(Collection).filter(
-        Collection.user_id == current_user.id,
-        Collection.is_deleted.is_(False),
+    query = (
+        db.query(Collection)
+        .options(raiseload("*"))
+        .filter(
+            Collection.user_id == current_user.id,
+            Collection.is_deleted.is_(False),
+        )
     )
 
     total = query.count()
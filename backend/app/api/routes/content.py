@@ -15,6 +15,7 @@ from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.nextauth import get_current_user
+from app.core.pricing import get_tier_config, is_unlimited
 from app.core.rate_limit import limiter
 from app.db.base import get_db
 from app.models import Video, User, Chunk
@@ -207,7 +208,6 @@ async def get_content_limits(
     current_user: User = Depends(get_current_user),
 ):
     """Get document upload limits for current user's tier."""
-    from app.core.pricing import get_tier_config
 
     user_tier = current_user.subscription_tier or "free"
     tier_config = get_tier_config(user_tier)
@@ -256,7 +256,6 @@ async def upload_content(
     file_content = await file.read()
     file_size_bytes = len(file_content)
 
-    from app.core.pricing import get_tier_config
     user_tier = current_user.subscription_tier or "free"
     tier_config = get_tier_config(user_tier)
     tier_max_mb = tier_config.get("max_upload_size_mb", settings.max_upload_size_mb)
@@ -274,7 +273,6 @@ async def upload_content(
 
     # Estimate word count for supported formats (fast, upfront check)
     max_document_words = tier_config.get("max_document_words", -1)
-    from app.core.pricing import is_unlimited
 
     if not is_unlimited(max_document_words):
         estimated_words = _estimate_word_count(file_content, content_type)
@@ -21,7 +21,7 @@ logger = logging.getLogger(__name__)
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from app.core.nextauth import get_current_user
 from app.db.base import get_db
@@ -433,6 +433,38 @@ def _refresh_selected_video_ids(db: Session, conversation: Conversation) -> None
     db.refresh(conversation)
 
 
+def _record_conversation_turn(
+    db: Session,
+    conversation_id: uuid.UUID,
+    last_message: MessageModel,
+    token_count: int = 0,
+) -> None:
+    """
+    Update a conversation's denormalized counters in a single UPDATE.
+
+    message_count is recounted by a correlated subquery (self-healing if a
+    turn failed half-way) and total_tokens_used is incremented in SQL, so
+    there is no SELECT round-trip and no Python read-modify-write race.
+    Pending messages are flushed first so the count and last_message's
+    created_at are final; the in-memory Conversation is left stale until the
+    next commit expires it.
+    """
+    db.flush()
+    message_count = (
+        db.query(func.count(MessageModel.id))
+        .filter(MessageModel.conversation_id == conversation_id)
+        .scalar_subquery()
+    )
+    db.query(Conversation).filter(Conversation.id == conversation_id).update(
+        {
+            Conversation.message_count: message_count,
+            Conversation.total_tokens_used: Conversation.total_tokens_used + token_count,
+            Conversation.last_message_at: last_message.created_at,
+        },
+        synchronize_session=False,
+    )
+
+
 def _ensure_conversation_owned(
     db: Session, conversation_id: uuid.UUID, current_user: User
 ) -> Conversation:
@@ -680,6 +712,7 @@ async def list_conversations(
         .outerjoin(msg_count_subq, Conversation.id == msg_count_subq.c.conversation_id)
         .outerjoin(video_ids_subq, Conversation.id == video_ids_subq.c.conversation_id)
         .outerjoin(last_msg_subq, Conversation.id == last_msg_subq.c.conversation_id)
+        .options(raiseload("*"))
         .filter(
             Conversation.user_id == current_user.id,
             Conversation.is_deleted.is_(False),
@@ -1760,7 +1793,9 @@ async def send_message(
 
     # Query chunks by ID
     if chunk_ids:
-        for chunk in db.query(Chunk).filter(Chunk.id.in_(chunk_ids)).all():
+        for chunk in (
+            db.query(Chunk).options(raiseload("*")).filter(Chunk.id.in_(chunk_ids)).all()
+        ):
             chunk_by_id[chunk.id] = chunk
 
     # Query chunks by (video_id, chunk_index) - needed because Qdrant doesn't store chunk_db_id
@@ -1769,6 +1804,7 @@ async def send_message(
         chunk_indices_for_query = list({idx for _, idx in video_index_pairs})
         candidate_chunks = (
             db.query(Chunk)
+            .options(raiseload("*"))
             .filter(Chunk.video_id.in_(video_ids_for_index))
             .filter(Chunk.chunk_index.in_(chunk_indices_for_query))
             .all()
@@ -1848,13 +1884,7 @@ async def send_message(
     assistant_message.chunks_retrieved_count = len(chunk_refs_response)
 
     # 11. Update conversation metadata
-    conversation.message_count = (
-        db.query(MessageModel)
-        .filter(MessageModel.conversation_id == conversation_id)
-        .count()
-    )
-    conversation.total_tokens_used += token_count
-    conversation.last_message_at = assistant_message.created_at
+    _record_conversation_turn(db, conversation_id, assistant_message, token_count)
 
     log_chat_message(
         db,
@@ -2348,13 +2378,19 @@ async def send_message_stream(
                         (c.video_id, c.chunk_index) for c in top_chunks if c.chunk_index is not None
                     ]
                     if chunk_ids:
-                        for chunk in persist_db.query(Chunk).filter(Chunk.id.in_(chunk_ids)).all():
+                        for chunk in (
+                            persist_db.query(Chunk)
+                            .options(raiseload("*"))
+                            .filter(Chunk.id.in_(chunk_ids))
+                            .all()
+                        ):
                             chunk_by_id[chunk.id] = chunk
                     if video_index_pairs:
                         video_ids_for_index = list({vid for vid, _ in video_index_pairs})
                         chunk_indices_for_query = list({idx for _, idx in video_index_pairs})
                         candidate_chunks = (
                             persist_db.query(Chunk)
+                            .options(raiseload("*"))
                             .filter(Chunk.video_id.in_(video_ids_for_index))
                             .filter(Chunk.chunk_index.in_(chunk_indices_for_query))
                             .all()
@@ -2514,14 +2550,7 @@ async def send_message_stream(
                 assistant_message.message_metadata = msg_metadata if msg_metadata else None
 
                 # Update conversation metadata
-                conversation_obj = persist_db.query(Conversation).filter(Conversation.id == _conv_id).first()
-                if conversation_obj:
-                    conversation_obj.message_count = (
-                        persist_db.query(MessageModel)
-                        .filter(MessageModel.conversation_id == _conv_id)
-                        .count()
-                    )
-                    conversation_obj.last_message_at = assistant_message.created_at
+                _record_conversation_turn(persist_db, _conv_id, assistant_message)
 
                 persist_db.commit()
 
@@ -2587,7 +2616,7 @@ async def send_message_stream(
                     extracted_facts = fact_service.extract_facts(
                         db=persist_db,
                         message=msg_refreshed or assistant_message,
-                        conversation=conv_refreshed or conversation_obj,
+                        conversation=conv_refreshed,
                         user_query=_user_message_text,
                     )
 
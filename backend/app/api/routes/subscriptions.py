@@ -9,7 +9,7 @@ Endpoints:
 - GET /subscriptions/current - Get current subscription details
 """
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from app.core.nextauth import get_current_user
@@ -199,11 +199,12 @@ async def get_pricing_tiers(request: Request):
     Public endpoint - does not require authentication.
     """
     try:
-        tiers = subscription_service.get_pricing_tiers()
-
-        logger.debug(f"Retrieved {len(tiers)} pricing tiers")
-
-        return tiers
+        # Static data: serve the pre-serialized body instead of re-validating
+        # and re-encoding the tier models on every request
+        return Response(
+            content=subscription_service.get_pricing_tiers_json(),
+            media_type="application/json",
+        )
 
     except Exception as e:
         logger.error(f"Error retrieving pricing tiers: {str(e)}", exc_info=True)
@@ -7,19 +7,25 @@ Endpoints:
 - GET /videos/{video_id} - Get video details
 - DELETE /videos/{video_id} - Delete video
 """
+import asyncio
+import hashlib
 import logging
+import os
+import time
 import uuid
-from typing import List, Optional
-from pathlib import Path
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
 
 logger = logging.getLogger(__name__)
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session, load_only, raiseload
 
 from sqlalchemy import func
 
 from app.core.nextauth import get_current_user
-from app.db.base import get_db
+from app.db.base import get_db, uuid7
 from app.models import Video, Job, Transcript, User, CollectionVideo, Chunk
 from app.schemas import (
     VideoIngestRequest,
@@ -46,7 +52,6 @@ from app.services.vector_store import vector_store_service
 from app.services.job_cancellation import (
     cancel_video_processing,
     is_cancelable,
-    CleanupOption,
 )
 from app.tasks.video_tasks import process_video_pipeline
 from app.core.rate_limit import limiter
@@ -85,8 +90,9 @@ async def ingest_video(
             raise HTTPException(status_code=400, detail=error_message)
 
         # Check for duplicate - same YouTube video for same user
+        # Column-only lookup: no need to hydrate description/chapters to raise 400
         existing_video = (
-            db.query(Video)
+            db.query(Video.id, Video.title, Video.status)
             .filter(
                 Video.user_id == current_user.id,
                 Video.youtube_id == video_info["youtube_id"],
@@ -101,18 +107,28 @@ async def ingest_video(
             )
 
         # Check user quotas
-        from app.core.quota import check_video_quota, check_minutes_quota, check_storage_quota
-        await check_video_quota(current_user, db)
+        from app.core.quota import check_quotas
         duration_minutes = int(video_info["duration_seconds"] / 60)
-        await check_minutes_quota(current_user, duration_minutes, db)
 
         # Estimate storage impact for quota check
         # ~100MB average per video (transcript + chunks + vectors)
         estimated_storage_mb = 100.0
-        await check_storage_quota(current_user, estimated_storage_mb, db)
+        await check_quotas(
+            current_user,
+            db,
+            video=True,
+            minutes=duration_minutes,
+            storage_mb=estimated_storage_mb,
+        )
+
+        # Primary keys are generated client-side, so both rows can be written
+        # in one flush without flush/refresh round trips to learn their IDs
+        video_id = uuid.uuid4()
+        job_id = uuid7()
 
         # Create video record
         video = Video(
+            id=video_id,
             user_id=current_user.id,
             youtube_id=video_info["youtube_id"],
             youtube_url=ingest_request.youtube_url,
@@ -130,37 +146,35 @@ async def ingest_video(
             status="pending",
             progress_percent=0.0,
         )
-        db.add(video)
-        db.flush()
 
         # Create job record
         job = Job(
+            id=job_id,
             user_id=current_user.id,
-            video_id=video.id,
+            video_id=video_id,
             job_type="full_pipeline",
             status="pending",
             progress_percent=0.0,
         )
-        db.add(job)
+        db.add_all([video, job])
         db.commit()
-        db.refresh(video)
-        db.refresh(job)
 
         # Queue background task
         task = process_video_pipeline.delay(
-            video_id=str(video.id),
+            video_id=str(video_id),
             youtube_url=ingest_request.youtube_url,
             user_id=str(current_user.id),
-            job_id=str(job.id),
+            job_id=str(job_id),
         )
 
         # Update job with Celery task ID
         job.celery_task_id = task.id
         db.commit()
+        _invalidate_list_cache(current_user.id)
 
         return VideoIngestResponse(
-            video_id=video.id,
-            job_id=job.id,
+            video_id=video_id,
+            job_id=job_id,
             status="pending",
             message="Video ingestion started. Use the job_id to track progress.",
         )
@@ -185,8 +199,52 @@ SORT_MAP = {
 }
 
 
-@router.get("", response_model=VideoList)
+def _to_video_detail(video: Video) -> VideoDetail:
+    """
+    Build a VideoDetail from an ORM row without a validation pass.
+
+    The values come straight from our own database columns, so pydantic's
+    per-field validation (UUIDs, datetimes, lists) is redundant here.
+    """
+    return VideoDetail.model_construct(
+        **{name: getattr(video, name) for name in VideoDetail.model_fields}
+    )
+
+
+# Per-process cache of rendered list pages.
+# key: (user_id, etag) -> (JSON body bytes, timestamp). The ETag already encodes the
+# query params and the user's library fingerprint, so entries never go stale;
+# the TTL and size cap only bound memory.
+_LIST_CACHE_TTL_SECONDS = 60
+_LIST_CACHE_MAX_SIZE = 256
+_list_cache: Dict[tuple, tuple] = {}
+
+
+def _invalidate_list_cache(user_id: uuid.UUID) -> None:
+    """Drop cached list pages for a user after their library changes."""
+    user_key = str(user_id)
+    for key in [k for k in _list_cache if k[0] == user_key]:
+        _list_cache.pop(key, None)
+
+
+def _get_cached_list(key: tuple) -> Optional[bytes]:
+    cached = _list_cache.get(key)
+    if cached and (time.time() - cached[1]) < _LIST_CACHE_TTL_SECONDS:
+        return cached[0]
+    return None
+
+
+def _set_cached_list(key: tuple, body: bytes) -> None:
+    if len(_list_cache) >= _LIST_CACHE_MAX_SIZE:
+        # Evict oldest entry
+        oldest_key = min(_list_cache, key=lambda k: _list_cache[k][1])
+        del _list_cache[oldest_key]
+    _list_cache[key] = (body, time.time())
+
+
+@router.get("", response_model=VideoList, response_class=ORJSONResponse)
 async def list_videos(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=100, description="Number of records to return"),
     status: Optional[str] = Query(None, description="Filter by status"),
@@ -202,6 +260,10 @@ async def list_videos(
     """
     List user's videos with pagination, search, filtering, and sorting.
 
+    Responses carry an ETag derived from the query parameters and the user's
+    library fingerprint (video count + latest updated_at). A matching
+    If-None-Match returns 304, and unchanged pages are served from cache.
+
     Args:
         skip: Number of records to skip
         limit: Number of records to return
@@ -216,122 +278,90 @@ async def list_videos(
     Returns:
         VideoList with videos and total count
     """
-    query = db.query(Video).filter(
-        Video.user_id == current_user.id,
-        Video.is_deleted.is_(False),
-        Video.content_type == "youtube",
-    )
+    # Sync Session work runs in a worker thread so the event loop stays free
+    def _load_fingerprint():
+        return (
+            db.query(func.count(Video.id), func.max(Video.updated_at))
+            .filter(
+                Video.user_id == current_user.id,
+                Video.is_deleted.is_(False),
+                Video.content_type == "youtube",
+            )
+            .one()
+        )
 
-    # Apply status filter
-    if status:
-        query = query.filter(Video.status == status)
+    video_count, last_updated_at = await asyncio.to_thread(_load_fingerprint)
+    params = (skip, limit, status, q, sort, channel, tags, duration_min, duration_max)
+    fingerprint = repr((str(current_user.id), params, video_count, last_updated_at))
+    etag = f'"{hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest()}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
 
-    # Apply text search
-    if q:
-        search_term = f"%{q}%"
-        query = query.filter(
-            Video.title.ilike(search_term)
-            | Video.description.ilike(search_term)
-            | Video.channel_name.ilike(search_term)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers)
+
+    cache_key = (str(current_user.id), etag)
+    cached = _get_cached_list(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json", headers=cache_headers)
+
+    def _load_page():
+        query = db.query(Video).filter(
+            Video.user_id == current_user.id,
+            Video.is_deleted.is_(False),
+            Video.content_type == "youtube",
         )
 
-    # Apply channel filter
-    if channel:
-        query = query.filter(Video.channel_name == channel)
+        # Apply status filter
+        if status:
+            query = query.filter(Video.status == status)
+
+        # Apply text search
+        if q:
+            search_term = f"%{q}%"
+            query = query.filter(
+                Video.title.ilike(search_term)
+                | Video.description.ilike(search_term)
+                | Video.channel_name.ilike(search_term)
+            )
 
-    # Apply tag filter (OR logic using PostgreSQL array overlap)
-    if tags:
-        tag_list = [t.strip() for t in tags.split(",") if t.strip()]
-        if tag_list:
-            query = query.filter(Video.tags.overlap(tag_list))
+        # Apply channel filter
+        if channel:
+            query = query.filter(Video.channel_name == channel)
 
-    # Apply duration filters
-    if duration_min is not None:
-        query = query.filter(Video.duration_seconds >= duration_min)
-    if duration_max is not None:
-        query = query.filter(Video.duration_seconds <= duration_max)
+        # Apply tag filter (OR logic using PostgreSQL array overlap)
+        if tags:
+            tag_list = [t.strip() for t in tags.split(",") if t.strip()]
+            if tag_list:
+                query = query.filter(Video.tags.overlap(tag_list))
 
-    # Get total count
-    total = query.count()
+        # Apply duration filters
+        if duration_min is not None:
+            query = query.filter(Video.duration_seconds >= duration_min)
+        if duration_max is not None:
+            query = query.filter(Video.duration_seconds <= duration_max)
 
-    # Apply sort
-    sort_clause = SORT_MAP.get(sort, Video.created_at.desc())
-    videos = query.order_by(sort_clause).offset(skip).limit(limit).all()
+        # Get total count
+        total = query.count()
 
-    video_ids = [v.id for v in videos]
-    transcripts = (
-        db.query(Transcript).filter(Transcript.video_id.in_(video_ids)).all()
-        if video_ids
-        else []
-    )
-    transcript_map = {t.video_id: t for t in transcripts}
+        # Apply sort
+        sort_clause = SORT_MAP.get(sort, Video.created_at.desc())
+        page = query.order_by(sort_clause).offset(skip).limit(limit)
 
-    # Calculate chunk storage per video (sum of all text fields: text + chunk_summary + embedding_text)
-    # This matches StorageCalculator behavior for consistent storage reporting
-    chunk_sizes = (
-        db.query(
-            Chunk.video_id,
-            func.sum(
-                func.coalesce(func.length(Chunk.text), 0)
-                + func.coalesce(func.length(Chunk.chunk_summary), 0)
-                + func.coalesce(func.length(Chunk.embedding_text), 0)
-            ).label("chunk_bytes"),
-        )
-        .filter(Chunk.video_id.in_(video_ids))
-        .group_by(Chunk.video_id)
-        .all()
-        if video_ids
-        else []
-    )
-    chunk_size_map = {cs.video_id: cs.chunk_bytes or 0 for cs in chunk_sizes}
+        # Storage sizes are persisted on the Video row when processing
+        # completes; rows are dumped to plain dicts as they stream in
+        videos = [
+            _to_video_detail(video).model_dump()
+            for video in page.yield_per(50)
+        ]
 
-    def get_transcript_size_mb(video: Video) -> float:
-        # Priority: actual file size > text encoding estimate
-        if video.transcript_file_path:
-            try:
-                file_path = Path(video.transcript_file_path)
-                if file_path.exists():
-                    return file_path.stat().st_size / (1024 * 1024)
-            except (OSError, IOError):
-                pass  # Fall through to estimate
-
-        # Fallback to text encoding estimate
-        transcript = transcript_map.get(video.id)
-        if transcript and transcript.full_text:
-            return len(transcript.full_text.encode("utf-8")) / (1024 * 1024)
-        return 0.0
-
-    def get_chunk_storage_mb(video: Video) -> float:
-        """Calculate chunk storage in MB from text bytes."""
-        text_bytes = chunk_size_map.get(video.id, 0)
-        return text_bytes / (1024 * 1024)
-
-    def get_vector_storage_mb(video: Video) -> float:
-        """Estimate vector storage: ~5KB per chunk."""
-        if video.chunk_count == 0:
-            return 0.0
-        return (video.chunk_count * 5.0) / 1024.0
-
-    video_details: List[VideoDetail] = []
-    for video in videos:
-        transcript_size_mb = round(get_transcript_size_mb(video), 3)
-        chunk_storage_mb = round(get_chunk_storage_mb(video), 3)
-        vector_storage_mb = round(get_vector_storage_mb(video), 3)
-        # Total is now: transcript + chunks + vectors (audio is 0)
-        storage_total_mb = round(transcript_size_mb + chunk_storage_mb + vector_storage_mb, 3)
-        base = VideoDetail.model_validate(video)
-        video_details.append(
-            base.model_copy(
-                update={
-                    "transcript_size_mb": transcript_size_mb,
-                    "chunk_storage_mb": chunk_storage_mb,
-                    "vector_storage_mb": vector_storage_mb,
-                    "storage_total_mb": storage_total_mb,
-                }
-            )
-        )
+        return total, videos
+
+    total, videos = await asyncio.to_thread(_load_page)
 
-    return VideoList(total=total, videos=video_details)
+    # Bypass response_model re-validation; orjson serializes the plain dicts
+    json_response = ORJSONResponse({"total": total, "videos": videos}, headers=cache_headers)
+    _set_cached_list(cache_key, json_response.body)
+    return json_response
 
 
 @router.get("/filters")
@@ -388,7 +418,7 @@ async def get_video_filters(
 
 
 @router.get("/{video_id}", response_model=VideoDetail)
-async def get_video(
+def get_video(
     video_id: uuid.UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -416,56 +446,7 @@ async def get_video(
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
-    # Calculate transcript size - prefer actual file size over text estimate
-    transcript_size_mb = 0.0
-    if video.transcript_file_path:
-        try:
-            file_path = Path(video.transcript_file_path)
-            if file_path.exists():
-                transcript_size_mb = file_path.stat().st_size / (1024 * 1024)
-        except (OSError, IOError):
-            pass
-
-    # Fallback to text encoding estimate if file not found
-    if transcript_size_mb == 0.0:
-        transcript = db.query(Transcript).filter(Transcript.video_id == video_id).first()
-        if transcript and transcript.full_text:
-            transcript_size_mb = len(transcript.full_text.encode("utf-8")) / (1024 * 1024)
-
-    # Calculate chunk storage (sum of all text fields: text + chunk_summary + embedding_text)
-    # This matches StorageCalculator behavior for consistent storage reporting
-    chunk_bytes = (
-        db.query(
-            func.sum(
-                func.coalesce(func.length(Chunk.text), 0)
-                + func.coalesce(func.length(Chunk.chunk_summary), 0)
-                + func.coalesce(func.length(Chunk.embedding_text), 0)
-            )
-        )
-        .filter(Chunk.video_id == video_id)
-        .scalar()
-        or 0
-    )
-    chunk_storage_mb = chunk_bytes / (1024 * 1024)
-
-    # Estimate vector storage: ~5KB per chunk
-    vector_storage_mb = (video.chunk_count * 5.0) / 1024.0 if video.chunk_count > 0 else 0.0
-
-    transcript_size_mb = round(transcript_size_mb, 3)
-    chunk_storage_mb = round(chunk_storage_mb, 3)
-    vector_storage_mb = round(vector_storage_mb, 3)
-    # Total is now: transcript + chunks + vectors (audio is 0)
-    storage_total_mb = round(transcript_size_mb + chunk_storage_mb + vector_storage_mb, 3)
-
-    base = VideoDetail.model_validate(video)
-    return base.model_copy(
-        update={
-            "transcript_size_mb": transcript_size_mb,
-            "chunk_storage_mb": chunk_storage_mb,
-            "vector_storage_mb": vector_storage_mb,
-            "storage_total_mb": storage_total_mb,
-        }
-    )
+    return _to_video_detail(video)
 
 
 @router.get("/{video_id}/transcript", response_model=TranscriptDetail)
@@ -479,8 +460,8 @@ async def get_video_transcript(
 
     Returns the complete text plus time-coded segments for review.
     """
-    video = (
-        db.query(Video)
+    video_exists = (
+        db.query(Video.id)
         .filter(
             Video.id == video_id,
             Video.user_id == current_user.id,
@@ -489,7 +470,7 @@ async def get_video_transcript(
         .first()
     )
 
-    if not video:
+    if not video_exists:
         raise HTTPException(status_code=404, detail="Video not found")
 
     transcript = db.query(Transcript).filter(Transcript.video_id == video_id).first()
@@ -514,8 +495,8 @@ async def get_video_collections(
     Returns:
         Dict with collection_ids array
     """
-    video = (
-        db.query(Video)
+    video_exists = (
+        db.query(Video.id)
         .filter(
             Video.id == video_id,
             Video.user_id == current_user.id,
@@ -524,7 +505,7 @@ async def get_video_collections(
         .first()
     )
 
-    if not video:
+    if not video_exists:
         raise HTTPException(status_code=404, detail="Video not found")
 
     # Get all collection IDs for this video
@@ -553,6 +534,20 @@ async def reprocess_video(
     """
     video = (
         db.query(Video)
+        .options(
+            # Only the columns used by quota checks and reset_video_processing
+            load_only(
+                Video.id,
+                Video.user_id,
+                Video.status,
+                Video.is_deleted,
+                Video.youtube_url,
+                Video.duration_seconds,
+                Video.audio_file_path,
+                Video.transcript_file_path,
+            ),
+            raiseload("*"),
+        )
         .filter(
             Video.id == video_id,
             Video.user_id == current_user.id,
@@ -566,14 +561,15 @@ async def reprocess_video(
     # Check user quotas before reprocessing
     # Note: Video already exists so we don't check video count quota
     # But we do check minutes and storage since reprocessing regenerates artifacts
-    from app.core.quota import check_minutes_quota, check_storage_quota
+    from app.core.quota import check_quotas
 
     duration_minutes = int((video.duration_seconds or 0) / 60)
-    await check_minutes_quota(current_user, duration_minutes, db)
 
     # Estimate storage impact for quota check (~100MB per video)
     estimated_storage_mb = 100.0
-    await check_storage_quota(current_user, estimated_storage_mb, db)
+    await check_quotas(
+        current_user, db, minutes=duration_minutes, storage_mb=estimated_storage_mb
+    )
 
     reset_video_processing(db, video=video, delete_files=False, delete_vectors=True)
 
@@ -596,6 +592,7 @@ async def reprocess_video(
     )
     job.celery_task_id = task.id
     db.commit()
+    _invalidate_list_cache(current_user.id)
 
     return VideoIngestResponse(
         video_id=video.id,
@@ -624,6 +621,7 @@ async def cancel_video(
     """
     video = (
         db.query(Video)
+        .options(raiseload("*"))
         .filter(
             Video.id == video_id,
             Video.user_id == current_user.id,
@@ -642,17 +640,9 @@ async def cancel_video(
             detail=f"Video cannot be canceled - status is '{video.status}'. Only videos in non-terminal statuses can be canceled.",
         )
 
-    # Parse cleanup option
-    try:
-        cleanup_option = CleanupOption(cancel_request.cleanup_option)
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid cleanup_option: {cancel_request.cleanup_option}. Must be 'keep_video' or 'full_delete'.",
-        )
-
     # Cancel the video
-    result = cancel_video_processing(db, video, cleanup_option)
+    result = cancel_video_processing(db, video, cancel_request.cleanup_option)
+    _invalidate_list_cache(current_user.id)
 
     if result.error:
         raise HTTPException(status_code=400, detail=result.error)
@@ -690,29 +680,25 @@ async def cancel_videos_bulk(
     if not bulk_request.video_ids:
         raise HTTPException(status_code=400, detail="No videos specified")
 
-    # Parse cleanup option
-    try:
-        cleanup_option = CleanupOption(bulk_request.cleanup_option)
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid cleanup_option: {bulk_request.cleanup_option}. Must be 'keep_video' or 'full_delete'.",
-        )
-
     results = []
     canceled_count = 0
     skipped_count = 0
 
-    for video_id in bulk_request.video_ids:
-        video = (
-            db.query(Video)
-            .filter(
-                Video.id == video_id,
-                Video.user_id == current_user.id,
-                Video.is_deleted.is_(False),
-            )
-            .first()
+    # Prefetch every requested video in one query instead of one SELECT per id
+    videos_by_id = {
+        video.id: video
+        for video in db.query(Video)
+        .options(raiseload("*"))
+        .filter(
+            Video.id.in_(bulk_request.video_ids),
+            Video.user_id == current_user.id,
+            Video.is_deleted.is_(False),
         )
+        .all()
+    }
+
+    for video_id in bulk_request.video_ids:
+        video = videos_by_id.get(video_id)
 
         if not video:
             results.append(
@@ -737,7 +723,7 @@ async def cancel_videos_bulk(
             skipped_count += 1
             continue
 
-        result = cancel_video_processing(db, video, cleanup_option)
+        result = cancel_video_processing(db, video, bulk_request.cleanup_option)
 
         if result.error:
             results.append(
@@ -760,6 +746,8 @@ async def cancel_videos_bulk(
             )
             canceled_count += 1
 
+    _invalidate_list_cache(current_user.id)
+
     return BulkCancelResponse(
         total=len(bulk_request.video_ids),
         canceled=canceled_count,
@@ -768,35 +756,93 @@ async def cancel_videos_bulk(
     )
 
 
-def _get_transcript_size_mb(video: Video) -> float:
+def _get_transcript_bytes_map(db: Session, video_ids: List[uuid.UUID]) -> dict:
+    """
+    Fetch stored transcript text sizes for many videos in a single query.
+
+    Returns:
+        Dict mapping video_id -> transcript text length (0 when no transcript)
+    """
+    if not video_ids:
+        return {}
+    rows = (
+        db.query(Transcript.video_id, func.length(Transcript.full_text))
+        .filter(Transcript.video_id.in_(video_ids))
+        .all()
+    )
+    return {video_id: text_bytes or 0 for video_id, text_bytes in rows}
+
+
+# Bucket width for the cross-request stat() cache; bounds how stale a size can be
+_STAT_CACHE_TTL_SECONDS = 30
+
+
+@lru_cache(maxsize=4096)
+def _cached_file_size(path: str, time_bucket: int) -> Optional[int]:
+    """
+    Return a file's size in bytes, or None if it does not exist.
+
+    time_bucket is part of the cache key only, so entries expire when the
+    bucket rolls over.
+    """
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+async def _stat_sizes(paths: Iterable[Optional[str]]) -> Dict[str, int]:
+    """
+    Stat many files concurrently in worker threads.
+
+    Keeps blocking filesystem calls (slow on network mounts) off the event loop.
+
+    Returns:
+        Dict mapping path -> size in bytes for files that exist
+    """
+    unique_paths = list({p for p in paths if p})
+    if not unique_paths:
+        return {}
+    time_bucket = int(time.monotonic() // _STAT_CACHE_TTL_SECONDS)
+    sizes = await asyncio.gather(
+        *[asyncio.to_thread(_cached_file_size, p, time_bucket) for p in unique_paths]
+    )
+    return {p: size for p, size in zip(unique_paths, sizes, strict=True) if size is not None}
+
+
+_BYTES_PER_MB = 1 << 20
+# Estimated vector index footprint per chunk (~3.3 KB)
+_INDEX_BYTES_PER_CHUNK = 3379
+
+
+def _get_transcript_bytes(
+    video: Video, transcript_bytes: int = 0, file_sizes: Optional[Dict[str, int]] = None
+) -> int:
     """
-    Get transcript size in MB.
+    Get transcript size in bytes.
 
     Priority:
     1. Actual file size on disk (most accurate)
-    2. Text encoding estimate (fallback if file not found)
+    2. Stored transcript text size (fallback if file not found)
+
+    Args:
+        video: Video record
+        transcript_bytes: Pre-fetched transcript text size (see _get_transcript_bytes_map)
+        file_sizes: Pre-fetched file sizes by path (see _stat_sizes)
     """
     # Try actual file size first
-    if video.transcript_file_path:
-        try:
-            file_path = Path(video.transcript_file_path)
-            if file_path.exists():
-                return file_path.stat().st_size / (1024 * 1024)
-        except (OSError, IOError):
-            pass  # Fall through to estimate
+    if video.transcript_file_path and file_sizes:
+        file_size = file_sizes.get(video.transcript_file_path)
+        if file_size is not None:
+            return file_size
 
-    # Fallback to text encoding estimate
-    transcript = video.transcript
-    if transcript and transcript.full_text:
-        return len(transcript.full_text.encode("utf-8")) / (1024 * 1024)
-    return 0.0
+    # Fallback to stored text size
+    return transcript_bytes
 
 
-def _estimate_index_size_mb(video: Video) -> float:
-    """Estimate vector index size (~3.3 KB per chunk)."""
-    if video.chunk_count == 0:
-        return 0.0
-    return (video.chunk_count * 3.3) / 1024.0
+def _estimate_index_bytes(video: Video) -> int:
+    """Estimate vector index size in bytes."""
+    return (video.chunk_count or 0) * _INDEX_BYTES_PER_CHUNK
 
 
 @router.post("/delete", response_model=VideoDeleteResponse)
@@ -823,15 +869,21 @@ async def delete_videos(
     if not request.video_ids:
         raise HTTPException(status_code=400, detail="No videos specified")
 
-    videos = (
-        db.query(Video)
-        .filter(
-            Video.id.in_(request.video_ids),
-            Video.user_id == current_user.id,
-            Video.is_deleted.is_(False),
+    # Sync Session work runs in a worker thread so the event loop stays free
+    def _load_videos():
+        videos = (
+            db.query(Video)
+            .filter(
+                Video.id.in_(request.video_ids),
+                Video.user_id == current_user.id,
+                Video.is_deleted.is_(False),
+            )
+            .all()
         )
-        .all()
-    )
+        # One aggregate query instead of lazy-loading video.transcript per row
+        return videos, _get_transcript_bytes_map(db, [v.id for v in videos])
+
+    videos, transcript_bytes_map = await asyncio.to_thread(_load_videos)
 
     if not videos:
         raise HTTPException(status_code=404, detail="No deletable videos found")
@@ -841,15 +893,21 @@ async def delete_videos(
             status_code=404, detail="Some videos not found or already deleted"
         )
 
+    file_sizes = await _stat_sizes(v.transcript_file_path for v in videos)
+
     breakdowns = []
     total_savings = 0.0
 
     for video in videos:
         # Calculate sizes
         audio_size = video.audio_file_size_mb or 0.0
-        transcript_size = round(_get_transcript_size_mb(video), 3)
-        index_size = round(_estimate_index_size_mb(video), 3)
-        total_size = audio_size + transcript_size + index_size
+        transcript_bytes = _get_transcript_bytes(
+            video, transcript_bytes_map.get(video.id, 0), file_sizes
+        )
+        index_bytes = _estimate_index_bytes(video)
+        transcript_size = round(transcript_bytes / _BYTES_PER_MB, 3)
+        index_size = round(index_bytes / _BYTES_PER_MB, 3)
+        total_size = audio_size + (transcript_bytes + index_bytes) / _BYTES_PER_MB
 
         breakdown = VideoDeleteBreakdown(
             video_id=video.id,
@@ -864,59 +922,76 @@ async def delete_videos(
         # Delete files if requested
         if request.delete_audio and video.audio_file_path:
             try:
-                audio_path = Path(video.audio_file_path)
-                if audio_path.exists():
-                    audio_path.unlink()
+                if os.path.exists(video.audio_file_path):
+                    os.unlink(video.audio_file_path)
             except Exception as e:
                 logger.warning(f"Failed to delete audio file: {str(e)}")
 
         if request.delete_transcript and video.transcript_file_path:
             try:
-                transcript_path = Path(video.transcript_file_path)
-                if transcript_path.exists():
-                    transcript_path.unlink()
+                if os.path.exists(video.transcript_file_path):
+                    os.unlink(video.transcript_file_path)
             except Exception as e:
                 logger.warning(f"Failed to delete transcript file: {str(e)}")
 
-        # Delete from vector store and clean up chunks if requested
-        if request.delete_search_index:
-            try:
-                vector_store_service.delete_video(video.id)
-            except Exception as e:
-                logger.warning(f"Failed to delete video from vector store: {str(e)}")
+        total_savings += total_size
+
+    video_ids = [video.id for video in videos]
+
+    # Delete from vector store and clean up chunks if requested
+    if request.delete_search_index:
+        # One filtered delete for all videos, run off the event loop
+        try:
+            await asyncio.to_thread(vector_store_service.delete_videos, video_ids)
+        except Exception as e:
+            logger.warning(f"Failed to delete videos from vector store: {str(e)}")
 
+    def _apply_db_deletes():
+        if request.delete_search_index:
             # Also delete chunk rows from PostgreSQL to avoid orphaned data
             try:
                 deleted_chunks = (
                     db.query(Chunk)
-                    .filter(Chunk.video_id == video.id)
+                    .filter(Chunk.video_id.in_(video_ids))
                     .delete(synchronize_session=False)
                 )
                 if deleted_chunks > 0:
-                    logger.debug(f"Deleted {deleted_chunks} chunks for video {video.id}")
+                    logger.debug(f"Deleted {deleted_chunks} chunks for {len(video_ids)} video(s)")
+                # Persisted sizes would otherwise keep reporting the purged chunks
+                db.query(Video).filter(Video.id.in_(video_ids)).update(
+                    {"chunk_bytes": 0, "chunk_count": 0},
+                    synchronize_session=False,
+                )
             except Exception as e:
                 logger.warning(f"Failed to delete chunks from database: {str(e)}")
 
         # Soft delete from database if requested
         if request.remove_from_library:
-            video.is_deleted = True
-            video.deleted_at = None  # Will be set by model
+            db.query(Video).filter(Video.id.in_(video_ids)).update(
+                {"is_deleted": True, "deleted_at": datetime.utcnow()},
+                synchronize_session=False,
+            )
 
             # Clean up CollectionVideo entries to maintain count consistency
             try:
                 deleted_cv = (
                     db.query(CollectionVideo)
-                    .filter(CollectionVideo.video_id == video.id)
+                    .filter(CollectionVideo.video_id.in_(video_ids))
                     .delete(synchronize_session=False)
                 )
                 if deleted_cv > 0:
-                    logger.debug(f"Removed video {video.id} from {deleted_cv} collection(s)")
+                    logger.debug(f"Removed {len(video_ids)} video(s) from {deleted_cv} collection link(s)")
             except Exception as e:
                 logger.warning(f"Failed to clean up collection associations: {str(e)}")
 
-        total_savings += total_size
+        db.commit()
 
-    db.commit()
+    await asyncio.to_thread(_apply_db_deletes)
+    _invalidate_list_cache(current_user.id)
+
+    if request.delete_audio or request.delete_transcript:
+        # Removed files must not be reported from the stat cache
+        _cached_file_size.cache_clear()
 
     return VideoDeleteResponse(
         deleted_count=len(videos),
@@ -972,6 +1047,7 @@ async def update_video_tags(
     """
     video = (
         db.query(Video)
+        .options(raiseload("*"))
         .filter(
             Video.id == video_id,
             Video.user_id == current_user.id,
@@ -986,6 +1062,7 @@ async def update_video_tags(
     video.tags = request.tags
     db.commit()
     db.refresh(video)
+    _invalidate_list_cache(current_user.id)
 
     return VideoDetail.model_validate(video)
 
@@ -1029,6 +1106,7 @@ async def bulk_update_tags(
             updated += 1
 
     db.commit()
+    _invalidate_list_cache(current_user.id)
 
     return {
         "updated": updated,
@@ -1058,8 +1136,8 @@ async def get_similar_videos(
         SimilarVideosResponse with ranked similar videos
     """
     # Verify video exists and belongs to user
-    video = (
-        db.query(Video)
+    video_exists = (
+        db.query(Video.id)
         .filter(
             Video.id == video_id,
             Video.user_id == current_user.id,
@@ -1068,7 +1146,7 @@ async def get_similar_videos(
         .first()
     )
 
-    if not video:
+    if not video_exists:
         raise HTTPException(status_code=404, detail="Video not found")
 
     from app.services.theme_service import get_theme_service
@@ -1103,8 +1181,8 @@ async def list_video_chunks(
     Supports text search across chunk text, titles, and keywords.
     """
     # Verify video exists and belongs to user
-    video = (
-        db.query(Video)
+    video_exists = (
+        db.query(Video.id)
         .filter(
             Video.id == video_id,
             Video.user_id == current_user.id,
@@ -1112,10 +1190,10 @@ async def list_video_chunks(
         )
         .first()
     )
-    if not video:
+    if not video_exists:
         raise HTTPException(status_code=404, detail="Video not found")
 
-    query = db.query(Chunk).filter(Chunk.video_id == video_id)
+    query = db.query(Chunk).options(raiseload("*")).filter(Chunk.video_id == video_id)
 
     if search:
         search_term = f"%{search.lower()}%"
@@ -3,11 +3,25 @@ Webhook endpoints.
 
 Currently supports Stripe subscription webhooks.
 """
-from fastapi import APIRouter, HTTPException, Request, status
-from app.core.config import settings
-from app.db.base import SessionLocal
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from app.core.admin_auth import get_admin_user
+from app.core.config import Settings, get_settings
 from app.core.rate_limit import limiter
-from app.services.subscription import subscription_service
+from app.models import User
+from app.schemas import StripeEventBatchRequest, StripeEventBatchResponse, StripeEventResult
+from app.tasks.subscription_tasks import (
+    claim_stripe_event,
+    handle_stripe_event,
+    process_stripe_event,
+    release_stripe_event,
+)
 import stripe
 import logging
 
@@ -15,13 +29,56 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Same replay window as stripe.Webhook.DEFAULT_TOLERANCE
+_STRIPE_SIGNATURE_TOLERANCE_SECONDS = 300
+
+def _match_signing_secret(payload: bytes, sig_header: str, secrets: List[str]) -> Optional[str]:
+    """
+    Return the first secret whose HMAC matches a v1 signature in the header.
+
+    The header is parsed once and each candidate is checked with a local
+    HMAC, so trying several secrets costs microseconds. Signatures older (or
+    newer) than the tolerance are rejected to block replays, as the Stripe
+    SDK does.
+    """
+    timestamp = None
+    signatures = []
+    for item in sig_header.split(","):
+        key, _, value = item.strip().partition("=")
+        if key == "t":
+            timestamp = value
+        elif key == "v1":
+            signatures.append(value)
+
+    if not timestamp or not signatures:
+        return None
+
+    try:
+        if abs(time.time() - int(timestamp)) > _STRIPE_SIGNATURE_TOLERANCE_SECONDS:
+            return None
+    except ValueError:
+        return None
+
+    signed_payload = timestamp.encode() + b"." + payload
+    for secret in secrets:
+        expected = hmac.new(secret.encode(), signed_payload, hashlib.sha256).hexdigest()
+        if any(hmac.compare_digest(expected, signature) for signature in signatures):
+            return secret
+    return None
+
 
 @router.post("/stripe")
 @limiter.limit("200/minute")
-async def stripe_webhook(request: Request):
+async def stripe_webhook(
+    request: Request,
+    settings: Settings = Depends(get_settings),
+):
     """
     Handle Stripe webhooks for subscription lifecycle events.
 
+    Only the signature is verified inline; the event is then queued for
+    app.tasks.subscription_tasks.process_stripe_event and 200 is returned.
+
     Processes events:
     - checkout.session.completed: User completed payment
     - customer.subscription.created: Subscription created
@@ -30,7 +87,8 @@ async def stripe_webhook(request: Request):
     - invoice.payment_succeeded: Payment successful
     - invoice.payment_failed: Payment failed
     """
-    if not hasattr(settings, 'stripe_webhook_secret') or not settings.stripe_webhook_secret:
+    secrets = settings.stripe_webhook_signing_secrets
+    if not secrets:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Stripe webhook secret not configured",
@@ -45,76 +103,150 @@ async def stripe_webhook(request: Request):
             detail="Missing stripe-signature header",
         )
 
-    try:
-        # Verify webhook signature
-        event = stripe.Webhook.construct_event(
-            payload, sig_header, settings.stripe_webhook_secret
+    # Verify the signature locally; the verified payload is then parsed once
+    # into a plain dict instead of building stripe.Event proxy objects
+    if _match_signing_secret(payload, sig_header, secrets) is None:
+        logger.error("Invalid Stripe webhook signature: no configured secret matched")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid signature",
         )
-    except ValueError as e:
+
+    try:
+        event = json.loads(payload)
+        event_id = event["id"]
+        event_type = event["type"]
+        event_data = event["data"]["object"]
+    except (ValueError, KeyError, TypeError) as e:
         logger.error(f"Invalid Stripe webhook payload: {e}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid payload",
         ) from e
-    except stripe.error.SignatureVerificationError as e:
-        logger.error(f"Invalid Stripe webhook signature: {e}")
+
+    # Stripe redelivers on any non-2xx or timeout; skip events already queued
+    if not claim_stripe_event(event_id):
+        logger.info(f"Duplicate Stripe webhook ignored: {event_type} ({event_id})")
+        return {"status": "ok", "dedup": True}
+
+    logger.info(f"Received Stripe webhook: {event_type}")
+
+    # Hand off DB work to the webhooks queue and acknowledge immediately
+    try:
+        process_stripe_event.apply_async(
+            args=[event_type, event_data],
+            kwargs={"event_id": event_id},
+            queue="webhooks",
+            retry=True,
+            retry_policy={"max_retries": 3},
+        )
+    except Exception as e:
+        # Broker unavailable — return 500 so Stripe retries delivery
+        release_stripe_event(event_id)
+        logger.error(
+            f"Failed to enqueue Stripe webhook {event_type}: {str(e)}",
+            exc_info=True,
+        )
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid signature",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Webhook processing failed, please retry",
         ) from e
 
-    # Get event type and data
-    event_type = event["type"]
-    event_data = event["data"]["object"]
+    return {"status": "ok"}
 
-    logger.info(f"Received Stripe webhook: {event_type}")
 
-    # Handle events
-    with SessionLocal() as db:
-        try:
-            if event_type == "checkout.session.completed":
-                # Payment successful, create subscription
-                subscription_service.handle_checkout_completed(event_data, db)
-
-            elif event_type == "customer.subscription.created":
-                # Subscription created (handled by checkout.session.completed)
-                logger.info(f"Subscription created: {event_data['id']}")
-
-            elif event_type == "customer.subscription.updated":
-                # Subscription updated (status change, plan change, etc.)
-                subscription_service.handle_subscription_updated(event_data, db)
-
-            elif event_type == "customer.subscription.deleted":
-                # Subscription canceled
-                subscription_service.handle_subscription_deleted(event_data, db)
-
-            elif event_type == "invoice.payment_succeeded":
-                # Payment succeeded - subscription renewed
-                logger.info(f"Payment succeeded for subscription: {event_data.get('subscription')}")
-
-            elif event_type == "invoice.payment_failed":
-                # Payment failed - mark subscription as past_due
-                subscription_service.handle_payment_failed(event_data, db)
-
-            else:
-                # Log unhandled event type
-                logger.debug(f"Unhandled Stripe event type: {event_type}")
-
-        except (KeyError, ValueError, TypeError) as e:
-            # Permanent errors (bad data shape) — return 200 so Stripe doesn't retry
-            logger.error(
-                f"Permanent error processing Stripe webhook {event_type}: {str(e)}",
-                exc_info=True,
+@router.post("/stripe/batch", response_model=StripeEventBatchResponse)
+async def replay_stripe_events(
+    batch_request: StripeEventBatchRequest,
+    admin_user: User = Depends(get_admin_user),
+    settings: Settings = Depends(get_settings),
+):
+    """
+    Re-process a batch of Stripe events concurrently (admin only).
+
+    Used to backfill missed deliveries (e.g. IDs from stripe.Event.list).
+    Events are fetched from the Stripe API by ID rather than trusted from the
+    request body. They are then grouped by customer and each group is applied
+    in Stripe's `created` order, so a stale subscription.updated cannot land
+    after a later subscription.deleted. Only the groups run concurrently (at
+    most settings.webhook_batch_concurrency at once). Each event takes the
+    same dedup claim as the webhook endpoint: events already processed are
+    reported as dedup, and a later redelivery of a replayed event is ignored.
+    One failing event does not stop the rest.
+    """
+    semaphore = asyncio.Semaphore(max(1, settings.webhook_batch_concurrency))
+    # Drop duplicate IDs: checkout handling is not idempotent
+    event_ids = list(dict.fromkeys(batch_request.event_ids))
+
+    def _fetch(event_id: str) -> dict:
+        event = stripe.Event.retrieve(event_id)
+        return {
+            "id": event_id,
+            "type": event["type"],
+            "created": event["created"],
+            "object": stripe.util.convert_to_dict(event["data"]["object"]),
+        }
+
+    def _apply(event: dict) -> StripeEventResult:
+        event_id, event_type = event["id"], event["type"]
+        if not claim_stripe_event(event_id):
+            return StripeEventResult(
+                event_id=event_id, event_type=event_type, success=True, dedup=True
             )
+        try:
+            handle_stripe_event(event_type, event["object"])
         except Exception as e:
-            # Transient errors (DB down, network issue) — return 500 so Stripe retries
-            logger.error(
-                f"Transient error processing Stripe webhook {event_type}: {str(e)}",
-                exc_info=True,
+            # Let a later replay or Stripe redelivery try again
+            release_stripe_event(event_id)
+            logger.error(f"Failed to replay Stripe event {event_id}: {str(e)}")
+            return StripeEventResult(
+                event_id=event_id, event_type=event_type, success=False, error=str(e)
             )
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Webhook processing failed, please retry",
-            ) from e
-
-    return {"status": "ok"}
+        return StripeEventResult(event_id=event_id, event_type=event_type, success=True)
+
+    def _apply_in_order(events: List[dict]) -> List[StripeEventResult]:
+        # sorted() is stable, so same-second events keep their request order
+        return [_apply(event) for event in sorted(events, key=lambda e: e["created"])]
+
+    async def _bounded(func, arg):
+        async with semaphore:
+            # Stripe API + sync Session work runs in a worker thread
+            return await asyncio.to_thread(func, arg)
+
+    fetched = await asyncio.gather(
+        *[_bounded(_fetch, event_id) for event_id in event_ids],
+        return_exceptions=True,
+    )
+
+    results_by_id = {}
+    groups: dict = {}
+    for event_id, outcome in zip(event_ids, fetched, strict=True):
+        if isinstance(outcome, Exception):
+            logger.error(f"Failed to fetch Stripe event {event_id}: {str(outcome)}")
+            results_by_id[event_id] = StripeEventResult(
+                event_id=event_id, success=False, error=str(outcome)
+            )
+            continue
+        obj = outcome["object"]
+        groups.setdefault(obj.get("customer") or obj.get("id"), []).append(outcome)
+
+    for group_results in await asyncio.gather(
+        *[_bounded(_apply_in_order, events) for events in groups.values()]
+    ):
+        for result in group_results:
+            results_by_id[result.event_id] = result
+
+    results = [results_by_id[event_id] for event_id in event_ids]
+    failed = sum(1 for result in results if not result.success)
+    skipped = sum(1 for result in results if result.dedup)
+    logger.info(
+        f"Admin {admin_user.id} replayed {len(results)} Stripe event(s), "
+        f"{failed} failed, {skipped} already processed"
+    )
+
+    return StripeEventBatchResponse(
+        processed=len(results) - failed - skipped,
+        failed=failed,
+        skipped=skipped,
+        results=results,
+    )
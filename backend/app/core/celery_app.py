@@ -8,12 +8,16 @@ Handles background tasks for:
 - Embedding and indexing
 - Scheduled cleanup
 """
+import logging
+
 from celery import Celery
 from celery.schedules import crontab
 from celery.signals import task_prerun, task_postrun, task_failure
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Create Celery app
 celery_app = Celery(
     "rag_transcript",
@@ -25,13 +29,16 @@ celery_app = Celery(
         "app.tasks.discovery_tasks",
         "app.tasks.document_tasks",
         "app.tasks.memory_tasks",
+        "app.tasks.subscription_tasks",
     ],
 )
 
 # Celery configuration
 celery_app.conf.update(
     task_serializer="json",
-    accept_content=["json"],
+    # msgpack is opted into per task (see subscription_tasks); JSON stays the
+    # default because some task results carry values msgpack can't encode
+    accept_content=["json", "msgpack"],
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
@@ -44,7 +51,15 @@ celery_app.conf.update(
     task_reject_on_worker_lost=True,  # Requeue task if worker dies
     # Redis visibility timeout must exceed task_time_limit to prevent redelivery
     # Default is 3600s (1h) which causes duplicate task execution for long-running tasks
-    broker_transport_options={"visibility_timeout": 18000},  # 5 hours
+    broker_transport_options={
+        "visibility_timeout": 18000,  # 5 hours
+        "socket_keepalive": True,
+        "health_check_interval": 30,
+    },
+    # Reuse broker connections; workers recycle every 50 tasks so setup cost adds up
+    broker_pool_limit=20,
+    redis_socket_keepalive=True,
+    result_backend_transport_options={"retry_on_timeout": True},
 )
 
 # Task routes (assign tasks to specific queues)
@@ -53,6 +68,8 @@ celery_app.conf.task_routes = {
     "app.tasks.cleanup_tasks.*": {"queue": "celery"},
     "app.tasks.document_tasks.*": {"queue": "celery"},
     "app.tasks.memory_tasks.*": {"queue": "celery"},
+    # Separate queue so Stripe events are not stuck behind long video jobs
+    "app.tasks.subscription_tasks.*": {"queue": "webhooks"},
 }
 
 # Beat schedule for periodic tasks
@@ -111,16 +128,17 @@ celery_app.conf.beat_schedule = {
 @task_prerun.connect
 def task_prerun_handler(task_id, task, *args, **kwargs):
     """Handler called before task execution."""
-    print(f"Task starting: {task.name} (ID: {task_id})")
+    # Lazy %-args: these fire for every task, so skip formatting when filtered out
+    logger.info("Task starting: %s (ID: %s)", task.name, task_id)
 
 
 @task_postrun.connect
 def task_postrun_handler(task_id, task, *args, retval=None, **kwargs):
     """Handler called after task execution."""
-    print(f"Task completed: {task.name} (ID: {task_id})")
+    logger.info("Task completed: %s (ID: %s)", task.name, task_id)
 
 
 @task_failure.connect
 def task_failure_handler(task_id, exception, *args, **kwargs):
     """Handler called on task failure."""
-    print(f"Task failed: {task_id}, Exception: {str(exception)}")
+    logger.error("Task failed: %s, Exception: %s", task_id, exception)
@@ -3,27 +3,115 @@ NextAuth.js JWT verification for FastAPI.
 
 Verifies JWTs issued by NextAuth.js using the NEXTAUTH_SECRET.
 """
-from typing import Any, Dict
-from datetime import datetime
+import contextlib
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Optional
+from datetime import datetime, timedelta
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 import jwt
-from jwt.exceptions import InvalidTokenError
+from jwt.exceptions import InvalidSignatureError, InvalidTokenError
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.core.config import settings
+from app.core.config import Settings, get_settings, settings
 from app.db.base import get_db
 from app.models import User
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# last_login_at is activity-grade, not audit-grade: refresh it at most this
+# often so ordinary requests don't each open a write transaction
+_LAST_LOGIN_UPDATE_INTERVAL = timedelta(minutes=5)
 
-def verify_nextauth_token(token: str) -> Dict[str, Any]:
+# Per-process cache of resolved user IDs.
+# key: (sub, email) -> (user_id, timestamp). Only the ID is cached; the row is
+# reloaded by primary key on every hit so is_active/tier changes apply at once.
+# A hit skips the email lookup and the profile/last_login_at write-back.
+_USER_CACHE_TTL_SECONDS = 30
+_USER_CACHE_MAX_SIZE = 10_000
+_user_id_cache: Dict[tuple, tuple] = {}
+_user_id_cache_lock = threading.Lock()
+
+
+def _get_cached_user_id(key: tuple):
+    with _user_id_cache_lock:
+        cached = _user_id_cache.get(key)
+    if cached and (time.time() - cached[1]) < _USER_CACHE_TTL_SECONDS:
+        return cached[0]
+    return None
+
+
+def _set_cached_user_id(key: tuple, user_id) -> None:
+    with _user_id_cache_lock:
+        if key not in _user_id_cache and len(_user_id_cache) >= _USER_CACHE_MAX_SIZE:
+            # Evict oldest entry
+            oldest_key = min(_user_id_cache, key=lambda k: _user_id_cache[k][1])
+            del _user_id_cache[oldest_key]
+        _user_id_cache[key] = (user_id, time.time())
+
+
+def invalidate_user_cache(user_id=None) -> None:
+    """Drop cached identity mappings for a user (or all users if None)."""
+    with _user_id_cache_lock:
+        if user_id is None:
+            _user_id_cache.clear()
+            return
+        for key in [k for k, v in _user_id_cache.items() if v[0] == user_id]:
+            _user_id_cache.pop(key, None)
+
+
+# Per-process cache of verified token claims.
+# key: (sha256(token), secret, previous_secret) -> (claims, expires_at). Raw
+# tokens are never held; a hit skips the HMAC + JSON decode. Entries expire at
+# the token's exp (or after the TTL, if sooner), and keying on the secrets
+# makes a secret rotation/removal take effect immediately.
+_TOKEN_CACHE_TTL_SECONDS = 300
+_MAX_TOKEN_LENGTH = 8192  # Far above any real NextAuth session JWT
+_TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: Dict[tuple, tuple] = {}
+_token_cache_lock = threading.Lock()
+
+
+def _get_cached_claims(key: tuple) -> Optional[Dict[str, Any]]:
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached and time.time() < cached[1]:
+        return cached[0]
+    return None
+
+
+def _set_cached_claims(key: tuple, claims: Dict[str, Any]) -> None:
+    expires_at = time.time() + _TOKEN_CACHE_TTL_SECONDS
+    if isinstance(claims.get("exp"), int | float):
+        expires_at = min(expires_at, claims["exp"])
+    with _token_cache_lock:
+        if key not in _token_cache and len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+            # Evict oldest entry (dicts keep insertion order)
+            del _token_cache[next(iter(_token_cache))]
+        _token_cache[key] = (claims, expires_at)
+
+
+def _decode_with_secret(token: str, secret: str) -> Dict[str, Any]:
+    return jwt.decode(
+        token,
+        secret,
+        algorithms=["HS256"],
+        options={"verify_aud": False},  # NextAuth doesn't use aud by default
+    )
+
+
+def verify_nextauth_token(
+    token: str, config: Optional[Settings] = None
+) -> Dict[str, Any]:
     """
     Verify and decode a NextAuth.js JWT.
 
-    NextAuth.js uses HS256 (symmetric) signing with NEXTAUTH_SECRET.
+    NextAuth.js uses HS256 (symmetric) signing with NEXTAUTH_SECRET. If
+    NEXTAUTH_PREVIOUS_SECRET is set, tokens signed with it are also accepted.
     Token structure:
     {
       "sub": "google_provider_id",
@@ -33,31 +121,62 @@ def verify_nextauth_token(token: str) -> Dict[str, Any]:
       "iat": 1234567890,
       "exp": 1234567890
     }
+
+    config defaults to the global settings; get_current_user passes the
+    injected Settings so dependency overrides apply.
     """
-    if not settings.nextauth_secret:
+    config = config or settings
+    if not config.nextauth_secret:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="NextAuth secret not configured",
         )
 
-    try:
-        claims = jwt.decode(
-            token,
-            settings.nextauth_secret,
-            algorithms=["HS256"],
-            options={"verify_aud": False},  # NextAuth doesn't use aud by default
+    # Cheap structural check first: scanner/garbage tokens skip the
+    # hashing, base64 and HMAC work entirely
+    if len(token) > _MAX_TOKEN_LENGTH or token.count(".") != 2:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired authorization token",
         )
-        return claims
+
+    cache_key = (
+        hashlib.sha256(token.encode()).digest(),
+        config.nextauth_secret,
+        config.nextauth_previous_secret,
+    )
+    cached = _get_cached_claims(cache_key)
+    if cached is not None:
+        return dict(cached)
+
+    try:
+        claims = _decode_with_secret(token, config.nextauth_secret)
+    except InvalidSignatureError as exc:
+        # During a secret rotation, sessions signed with the previous secret
+        # stay valid until they expire instead of all failing at once
+        claims = None
+        if config.nextauth_previous_secret:
+            with contextlib.suppress(InvalidTokenError):
+                claims = _decode_with_secret(token, config.nextauth_previous_secret)
+        if claims is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired authorization token",
+            ) from exc
     except InvalidTokenError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired authorization token",
         ) from exc
 
+    _set_cached_claims(cache_key, claims)
+    return dict(claims)
+
 
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     db: Session = Depends(get_db),
+    settings: Settings = Depends(get_settings),
 ) -> User:
     """
     Resolve the current authenticated user from a NextAuth.js JWT.
@@ -80,7 +199,7 @@ def get_current_user(
         )
 
     token = credentials.credentials
-    claims = verify_nextauth_token(token)
+    claims = verify_nextauth_token(token, settings)
 
     oauth_provider_id = claims.get("sub")
     email = claims.get("email")
@@ -91,6 +210,19 @@ def get_current_user(
             detail="Invalid token: missing required claims",
         )
 
+    cache_key = (oauth_provider_id, email)
+    cached_user_id = _get_cached_user_id(cache_key)
+    if cached_user_id is not None:
+        user = db.get(User, cached_user_id)
+        if user is not None and user.email == email:
+            if not user.is_active:
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="User account is inactive",
+                )
+            return user
+        invalidate_user_cache(cached_user_id)
+
     # Look up user by email (primary identifier)
     user = db.query(User).filter(User.email == email).first()
 
@@ -103,28 +235,53 @@ def get_current_user(
             full_name=claims.get("name"),
             subscription_tier="free",
             is_active=True,
+            last_login_at=datetime.utcnow(),
         )
         # Elevate to admin if email is in ADMIN_EMAILS
         if email in settings.admin_emails:
             user.is_superuser = True
 
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        try:
+            db.commit()
+        except IntegrityError:
+            # A concurrent first request for the same email created the row
+            # between our SELECT and INSERT; use that row instead of a 500
+            db.rollback()
+            user = db.query(User).filter(User.email == email).first()
+            if user is None:
+                raise
+        # No refresh: the committed instance is expired and reloads itself
+        # once, on first attribute access
     else:
+        # Only write (and commit) when something actually changed
+        changed = False
+
         # Update oauth_provider_id and full_name if changed
-        user.oauth_provider_id = oauth_provider_id
-        if claims.get("name"):
-            user.full_name = claims.get("name")
+        if user.oauth_provider_id != oauth_provider_id:
+            user.oauth_provider_id = oauth_provider_id
+            changed = True
+        name = claims.get("name")
+        if name and user.full_name != name:
+            user.full_name = name
+            changed = True
 
         # Ensure admin emails stay elevated
         if email in settings.admin_emails and not user.is_superuser:
             user.is_superuser = True
+            changed = True
+
+        # Update last login, at most once per interval
+        now = datetime.utcnow()
+        if (
+            user.last_login_at is None
+            or now - user.last_login_at > _LAST_LOGIN_UPDATE_INTERVAL
+        ):
+            user.last_login_at = now
+            changed = True
 
-        # Update last login
-        user.last_login_at = datetime.utcnow()
-        db.commit()
-        db.refresh(user)
+        if changed:
+            db.commit()
 
     if not user.is_active:
         raise HTTPException(
@@ -132,4 +289,5 @@ def get_current_user(
             detail="User account is inactive",
         )
 
+    _set_cached_user_id(cache_key, user.id)
     return user
@@ -11,12 +11,28 @@ DeepSeek automatically caches prompt prefixes (system prompt, conversation histo
 reducing input costs by up to 90% for long conversations ($0.028/M for cache hits).
 
 See docs/MODEL_RESEARCH.md for detailed analysis.
+
+MODEL_TIERS and PRICING_TIERS are read-only (MappingProxyType) after import,
+so lookups can hand out shared references without copying.
 """
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
 from app.core.config import settings
 
 
+def _freeze(tiers: Dict[str, Dict[str, Any]]) -> Mapping[str, Mapping[str, Any]]:
+    """Wrap a tier table and its nested dicts in read-only views."""
+
+    def freeze(value):
+        if isinstance(value, dict):
+            return MappingProxyType({key: freeze(item) for key, item in value.items()})
+        return value
+
+    return freeze(tiers)
+
+
 # =============================================================================
 # LLM Model Configuration by Tier (DeepSeek API)
 # =============================================================================
@@ -35,7 +51,7 @@ from app.core.config import settings
 # - Automatic context caching (reduces costs for multi-turn conversations)
 # - Reasoner model provides chain-of-thought for complex queries
 
-MODEL_TIERS: Dict[str, Dict[str, Any]] = {
+MODEL_TIERS: Mapping[str, Mapping[str, Any]] = _freeze({
     "free": {
         "model_id": "deepseek-chat",
         "display_name": "DeepSeek Chat",
@@ -83,15 +99,21 @@ MODEL_TIERS: Dict[str, Dict[str, Any]] = {
             "limitations": ["Slightly slower due to reasoning step"],
         },
     },
-}
+})
 
+# Fallback for unknown tiers
+_FREE_MODEL_INFO = MODEL_TIERS["free"]
 
+
+@lru_cache(maxsize=8)
 def get_model_for_tier(tier: str) -> str:
     """
     Get the default LLM model ID for a subscription tier.
 
     Checks environment-configured overrides first (settings.llm_model_{tier}),
-    then falls back to MODEL_TIERS defaults.
+    then falls back to MODEL_TIERS defaults. Memoized: settings are fixed at
+    startup and there are only a handful of tiers (call cache_clear() in
+    tests that change llm_model_* settings).
 
     Args:
         tier: Subscription tier (free, pro, enterprise)
@@ -107,14 +129,11 @@ def get_model_for_tier(tier: str) -> str:
     if env_model:
         return env_model
 
-    if tier not in MODEL_TIERS:
-        # Fallback to free tier model if unknown tier
-        return MODEL_TIERS["free"]["model_id"]
-
-    return MODEL_TIERS[tier]["model_id"]
+    # Fallback to free tier model if unknown tier
+    return MODEL_TIERS.get(tier, _FREE_MODEL_INFO)["model_id"]
 
 
-def get_model_info_for_tier(tier: str) -> Dict[str, Any]:
+def get_model_info_for_tier(tier: str) -> Mapping[str, Any]:
     """
     Get full model information for a subscription tier.
 
@@ -122,12 +141,9 @@ def get_model_info_for_tier(tier: str) -> Dict[str, Any]:
         tier: Subscription tier (free, pro, enterprise)
 
     Returns:
-        Dictionary with model_id, display_name, description, and specs
+        Read-only mapping with model_id, display_name, description, and specs
     """
-    if tier not in MODEL_TIERS:
-        return MODEL_TIERS["free"]
-
-    return MODEL_TIERS[tier]
+    return MODEL_TIERS.get(tier, _FREE_MODEL_INFO)
 
 
 def resolve_model(
@@ -167,7 +183,7 @@ def resolve_model(
 # Pricing Tiers Configuration
 # =============================================================================
 
-PRICING_TIERS: Dict[str, Dict[str, Any]] = {
+PRICING_TIERS: Mapping[str, Mapping[str, Any]] = _freeze({
     "free": {
         "name": "Free",
         "description": "Perfect for getting started",
@@ -245,10 +261,10 @@ PRICING_TIERS: Dict[str, Dict[str, Any]] = {
         "max_upload_size_mb": 100,
         "model_tier": "enterprise",
     },
-}
+})
 
 
-def get_tier_config(tier: str) -> Dict[str, Any]:
+def get_tier_config(tier: str) -> Mapping[str, Any]:
     """
     Get configuration for a specific tier.
 
@@ -256,18 +272,34 @@ def get_tier_config(tier: str) -> Dict[str, Any]:
         tier: Tier name (free, pro, enterprise)
 
     Returns:
-        Tier configuration dictionary
+        Read-only tier configuration mapping
 
     Raises:
         ValueError: If tier is invalid
     """
-    if tier not in PRICING_TIERS:
+    config = PRICING_TIERS.get(tier)
+    if config is None:
         raise ValueError(f"Invalid tier: {tier}. Must be one of: {list(PRICING_TIERS.keys())}")
 
-    return PRICING_TIERS[tier]
+    return config
+
+
+# Quota limits per tier, extracted once at import. Read-only so callers can't
+# corrupt the shared copy; quota checks just do a dict lookup.
+_QUOTA_LIMIT_KEYS = (
+    "video_limit",
+    "document_limit",
+    "message_limit",
+    "storage_limit_mb",
+    "minutes_limit",
+)
+_QUOTA_LIMITS: Dict[str, Mapping[str, int]] = {
+    tier: MappingProxyType({key: config[key] for key in _QUOTA_LIMIT_KEYS})
+    for tier, config in PRICING_TIERS.items()
+}
 
 
-def get_quota_limits(tier: str) -> Dict[str, int]:
+def get_quota_limits(tier: str) -> Mapping[str, int]:
     """
     Get quota limits for a specific tier.
 
@@ -275,17 +307,16 @@ def get_quota_limits(tier: str) -> Dict[str, int]:
         tier: Tier name (free, pro, enterprise)
 
     Returns:
-        Dictionary with quota limits
+        Read-only mapping with quota limits
+
+    Raises:
+        ValueError: If tier is invalid
     """
-    config = get_tier_config(tier)
+    limits = _QUOTA_LIMITS.get(tier)
+    if limits is None:
+        raise ValueError(f"Invalid tier: {tier}. Must be one of: {list(PRICING_TIERS.keys())}")
 
-    return {
-        "video_limit": config["video_limit"],
-        "document_limit": config["document_limit"],
-        "message_limit": config["message_limit"],
-        "storage_limit_mb": config["storage_limit_mb"],
-        "minutes_limit": config["minutes_limit"],
-    }
+    return limits
 
 
 def is_unlimited(limit: int) -> bool:
@@ -312,10 +343,8 @@ def check_limit_exceeded(used: int, limit: int) -> bool:
     Returns:
         True if limit exceeded, False otherwise
     """
-    if is_unlimited(limit):
-        return False
-
-    return used >= limit
+    # Inlined is_unlimited(): called on every quota check
+    return limit != -1 and used >= limit
 
 
 def get_usage_percentage(used: int, limit: int) -> float:
@@ -329,7 +358,7 @@ def get_usage_percentage(used: int, limit: int) -> float:
     Returns:
         Usage percentage (0-100), or 0 for unlimited
     """
-    if is_unlimited(limit):
+    if limit == -1:  # unlimited
         return 0.0
 
     if limit == 0:
@@ -3,15 +3,57 @@ Quota enforcement middleware and utilities.
 
 Provides functions to check and enforce user quotas before allowing actions.
 """
+from functools import wraps
+
 from fastapi import HTTPException, status
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from app.models import User
+from app.schemas import QuotaUsage
 from app.services.subscription import subscription_service
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Quota usage is expensive to compute (several COUNTs, storage breakdown,
+# disk scan). Routes often run 2-3 checks back to back (e.g. video, minutes
+# and storage on ingest), so the result is kept on the session until its next
+# flush/commit/rollback, i.e. for the checks that precede the request's writes.
+_QUOTA_CACHE_KEY = "quota_usage_cache"
+
+
+def _get_quota(user: User, db: Session) -> QuotaUsage:
+    cache = db.info.setdefault(_QUOTA_CACHE_KEY, {})
+    quota = cache.get(user.id)
+    if quota is None:
+        quota = subscription_service.get_user_quota(user.id, db)
+        cache[user.id] = quota
+    return quota
+
+
+@event.listens_for(Session, "after_flush")
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_quota_cache(session, *args):
+    session.info.pop(_QUOTA_CACHE_KEY, None)
+
+
+def bypass_for_admin(quota_name: str):
+    """Skip the decorated quota check entirely for admin users."""
+
+    def decorator(check):
+        @wraps(check)
+        async def wrapper(user: User, *args, **kwargs):
+            if user.is_superuser:
+                logger.debug("Admin user %s bypassing %s quota check", user.id, quota_name)
+                return
+            return await check(user, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
 
 class QuotaExceededException(HTTPException):
     """Exception raised when user quota is exceeded."""
@@ -36,6 +78,7 @@ class QuotaExceededException(HTTPException):
         )
 
 
+@bypass_for_admin("video")
 async def check_video_quota(user: User, db: Session) -> None:
     """
     Check if user can ingest another video.
@@ -47,13 +90,8 @@ async def check_video_quota(user: User, db: Session) -> None:
     Raises:
         QuotaExceededException: If video quota exceeded
     """
-    # Admin users bypass all quotas
-    if user.is_superuser:
-        logger.info(f"Admin user {user.id} bypassing video quota check")
-        return
-
-    if not subscription_service.check_video_quota(user.id, db):
-        quota = subscription_service.get_user_quota(user.id, db)
+    quota = _get_quota(user, db)
+    if not (quota.videos_remaining > 0):
         logger.warning(f"Video quota exceeded for user {user.id}: {quota.videos_used}/{quota.videos_limit}")
 
         raise QuotaExceededException(
@@ -62,6 +100,7 @@ async def check_video_quota(user: User, db: Session) -> None:
         )
 
 
+@bypass_for_admin("document")
 async def check_document_quota(user: User, db: Session) -> None:
     """
     Check if user can upload another document.
@@ -73,13 +112,8 @@ async def check_document_quota(user: User, db: Session) -> None:
     Raises:
         QuotaExceededException: If document quota exceeded
     """
-    # Admin users bypass all quotas
-    if user.is_superuser:
-        logger.info(f"Admin user {user.id} bypassing document quota check")
-        return
-
-    if not subscription_service.check_document_quota(user.id, db):
-        quota = subscription_service.get_user_quota(user.id, db)
+    quota = _get_quota(user, db)
+    if not (quota.documents_remaining > 0):
         logger.warning(f"Document quota exceeded for user {user.id}: {quota.documents_used}/{quota.documents_limit}")
 
         raise QuotaExceededException(
@@ -88,6 +122,7 @@ async def check_document_quota(user: User, db: Session) -> None:
         )
 
 
+@bypass_for_admin("message")
 async def check_message_quota(user: User, db: Session) -> None:
     """
     Check if user can send another message.
@@ -99,13 +134,8 @@ async def check_message_quota(user: User, db: Session) -> None:
     Raises:
         QuotaExceededException: If message quota exceeded
     """
-    # Admin users bypass all quotas
-    if user.is_superuser:
-        logger.info(f"Admin user {user.id} bypassing message quota check")
-        return
-
-    if not subscription_service.check_message_quota(user.id, db):
-        quota = subscription_service.get_user_quota(user.id, db)
+    quota = _get_quota(user, db)
+    if not (quota.messages_remaining > 0):
         logger.warning(f"Message quota exceeded for user {user.id}: {quota.messages_used}/{quota.messages_limit}")
 
         raise QuotaExceededException(
@@ -114,6 +144,7 @@ async def check_message_quota(user: User, db: Session) -> None:
         )
 
 
+@bypass_for_admin("storage")
 async def check_storage_quota(user: User, file_size_mb: float, db: Session) -> None:
     """
     Check if user has enough storage quota for a file.
@@ -126,13 +157,8 @@ async def check_storage_quota(user: User, file_size_mb: float, db: Session) -> N
     Raises:
         QuotaExceededException: If storage quota exceeded
     """
-    # Admin users bypass all quotas
-    if user.is_superuser:
-        logger.info(f"Admin user {user.id} bypassing storage quota check")
-        return
-
-    if not subscription_service.check_storage_quota(user.id, file_size_mb, db):
-        quota = subscription_service.get_user_quota(user.id, db)
+    quota = _get_quota(user, db)
+    if not (quota.storage_remaining_mb >= file_size_mb):
         logger.warning(
             f"Storage quota exceeded for user {user.id}: "
             f"{quota.storage_used_mb:.2f}MB/{quota.storage_limit_mb}MB (requesting {file_size_mb:.2f}MB)"
@@ -144,6 +170,7 @@ async def check_storage_quota(user: User, file_size_mb: float, db: Session) -> N
         )
 
 
+@bypass_for_admin("minutes")
 async def check_minutes_quota(user: User, duration_minutes: int, db: Session) -> None:
     """
     Check if user has enough minutes quota for a video.
@@ -156,13 +183,8 @@ async def check_minutes_quota(user: User, duration_minutes: int, db: Session) ->
     Raises:
         QuotaExceededException: If minutes quota exceeded
     """
-    # Admin users bypass all quotas
-    if user.is_superuser:
-        logger.info(f"Admin user {user.id} bypassing minutes quota check")
-        return
-
-    if not subscription_service.check_minutes_quota(user.id, duration_minutes, db):
-        quota = subscription_service.get_user_quota(user.id, db)
+    quota = _get_quota(user, db)
+    if not (quota.minutes_remaining >= duration_minutes):
         logger.warning(
             f"Minutes quota exceeded for user {user.id}: "
             f"{quota.minutes_used}/{quota.minutes_limit} (requesting {duration_minutes} minutes)"
@@ -174,3 +196,40 @@ async def check_minutes_quota(user: User, duration_minutes: int, db: Session) ->
         )
 
 
+@bypass_for_admin("all")
+async def check_quotas(
+    user: User,
+    db: Session,
+    *,
+    video: bool = False,
+    message: bool = False,
+    storage_mb: float = 0.0,
+    minutes: int = 0,
+) -> None:
+    """
+    Check several quotas at once against a single usage snapshot.
+
+    Checks run in order video, minutes, storage, message; the first one that
+    fails raises. Dimensions left at their defaults are skipped.
+
+    Args:
+        user: User object
+        db: Database session
+        video: Check the video count quota
+        message: Check the message quota
+        storage_mb: Storage the action will add, in MB
+        minutes: Video duration the action will add, in minutes
+
+    Raises:
+        QuotaExceededException: If any requested quota is exceeded
+    """
+    # Usage is fetched once; the individual checks reuse it via _get_quota
+    _get_quota(user, db)
+    if video:
+        await check_video_quota(user, db)
+    if minutes:
+        await check_minutes_quota(user, minutes, db)
+    if storage_mb:
+        await check_storage_quota(user, storage_mb, db)
+    if message:
+        await check_message_quota(user, db)
@@ -1,6 +1,10 @@
 """
 Database session and base configuration.
 """
+import os
+import time
+import uuid
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -14,6 +18,8 @@ engine = create_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    pool_recycle=1800,  # Replace connections before server/proxy idle timeouts drop them
+    pool_use_lifo=True,  # Reuse the hottest connection; idle extras age out via recycle
 )
 
 # Create session factory
@@ -23,6 +29,19 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    48-bit millisecond timestamp followed by random bits, so new primary keys
+    land at the right edge of the B-tree instead of random pages.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 def get_db():
     """Dependency for getting database session."""
     db = SessionLocal()
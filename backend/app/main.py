@@ -8,9 +8,12 @@ Handles:
 - CORS setup
 - Startup/shutdown events
 """
-from fastapi import FastAPI, Request
+import asyncio
+
+import orjson
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 import logging
 
 from app.core.config import settings
@@ -49,6 +52,7 @@ app = FastAPI(
     description="RAG-powered YouTube video transcript system with semantic search and contextual chat",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    default_response_class=ORJSONResponse,
 )
 
 # Register rate limiter
@@ -65,17 +69,59 @@ app.add_middleware(
 )
 
 
-# Security headers middleware
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next):
-    """Add security headers to all responses."""
-    response = await call_next(request)
-    response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-    return response
+# Security headers added to every response, pre-encoded for the ASGI message
+_SECURITY_HEADERS = [
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+]
+
+
+class SecurityHeadersMiddleware:
+    """
+    Add security headers to all responses.
+
+    Plain ASGI rather than @app.middleware("http"): BaseHTTPMiddleware wraps
+    each request in an extra task and re-streams the body, which also slows
+    down the chat SSE responses.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *_SECURITY_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+app.add_middleware(SecurityHeadersMiddleware)
+
+
+def _backfill_fact_scores() -> None:
+    """Backfill importance/category for existing facts in its own session."""
+    try:
+        from app.db.base import SessionLocal
+        from app.services.fact_extraction import backfill_fact_scores
+
+        db = SessionLocal()
+        try:
+            updated = backfill_fact_scores(db)
+            if updated > 0:
+                logger.info(f"Backfilled importance/category for {updated} facts")
+        finally:
+            db.close()
+    except Exception as e:
+        logger.warning(f"Fact backfill skipped: {str(e)}")
 
 
 # Startup event
@@ -96,20 +142,9 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Failed to initialize vector store: {str(e)}")
 
-    # Backfill fact scores for existing facts (one-time migration, safe to re-run)
-    try:
-        from app.db.base import SessionLocal
-        from app.services.fact_extraction import backfill_fact_scores
-
-        db = SessionLocal()
-        try:
-            updated = backfill_fact_scores(db)
-            if updated > 0:
-                logger.info(f"Backfilled importance/category for {updated} facts")
-        finally:
-            db.close()
-    except Exception as e:
-        logger.warning(f"Fact backfill skipped: {str(e)}")
+    # Backfill fact scores for existing facts (one-time migration, safe to re-run).
+    # Runs in a worker thread so large fact tables don't delay readiness.
+    app.state.backfill_task = asyncio.create_task(asyncio.to_thread(_backfill_fact_scores))
 
     logger.info("Application startup complete")
 
@@ -120,97 +155,79 @@ async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info("Shutting down application")
 
+    backfill_task = getattr(app.state, "backfill_task", None)
+    if backfill_task is not None and not backfill_task.done():
+        backfill_task.cancel()
 
-# Health check endpoint
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {
+
+# Static endpoint payloads; settings are fixed for the life of the process.
+# /health is pre-encoded since load balancer probes hit it constantly.
+_HEALTH_BYTES = orjson.dumps(
+    {
         "status": "healthy",
         "app": settings.app_name,
         "version": settings.app_version,
         "environment": settings.environment,
     }
+)
+_ROOT_INFO = {
+    "app": settings.app_name,
+    "version": settings.app_version,
+    "docs": "/docs" if settings.debug else "Documentation disabled in production",
+    "health": "/health",
+}
+
+
+# Health check endpoint
+@app.get("/health")
+async def health_check():
+    """Health check endpoint."""
+    # New Response per call: middleware may append to its header list in place
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 # Root endpoint
 @app.get("/")
 async def root():
     """Root endpoint with API info."""
-    return {
-        "app": settings.app_name,
-        "version": settings.app_version,
-        "docs": "/docs" if settings.debug else "Documentation disabled in production",
-        "health": "/health",
-    }
-
-
-# Mount API routes
-app.include_router(
-    videos.router, prefix=f"{settings.api_v1_prefix}/videos", tags=["videos"]
-)
+    return _ROOT_INFO
 
-app.include_router(jobs.router, prefix=f"{settings.api_v1_prefix}/jobs", tags=["jobs"])
 
-app.include_router(
-    conversations.router,
-    prefix=f"{settings.api_v1_prefix}/conversations",
-    tags=["conversations"],
+# Mount API routes: (module, path under the API prefix, OpenAPI tag)
+_ROUTERS = (
+    (videos, "videos", "videos"),
+    (jobs, "jobs", "jobs"),
+    (conversations, "conversations", "conversations"),
+    (insights, "conversations", "insights"),
+    (collections, "collections", "collections"),
+    (usage, "usage", "usage"),
+    (auth, "auth", "auth"),
+    (admin, "admin", "admin"),
+    (webhooks, "webhooks", "webhooks"),
+    (subscriptions, "subscriptions", "subscriptions"),
+    (discovery, "discovery", "discovery"),
+    (notifications, "notifications", "notifications"),
+    (content, "content", "content"),
 )
 
-app.include_router(
-    insights.router, prefix=f"{settings.api_v1_prefix}/conversations", tags=["insights"]
-)
-
-app.include_router(
-    collections.router,
-    prefix=f"{settings.api_v1_prefix}/collections",
-    tags=["collections"],
-)
-
-app.include_router(
-    usage.router, prefix=f"{settings.api_v1_prefix}/usage", tags=["usage"]
-)
-
-app.include_router(auth.router, prefix=f"{settings.api_v1_prefix}/auth", tags=["auth"])
-
-app.include_router(
-    admin.router, prefix=f"{settings.api_v1_prefix}/admin", tags=["admin"]
-)
-
-app.include_router(
-    webhooks.router, prefix=f"{settings.api_v1_prefix}/webhooks", tags=["webhooks"]
-)
-
-app.include_router(
-    subscriptions.router, prefix=f"{settings.api_v1_prefix}/subscriptions", tags=["subscriptions"]
-)
-
-app.include_router(
-    discovery.router, prefix=f"{settings.api_v1_prefix}/discovery", tags=["discovery"]
-)
-
-app.include_router(
-    notifications.router, prefix=f"{settings.api_v1_prefix}/notifications", tags=["notifications"]
-)
-
-app.include_router(
-    content.router, prefix=f"{settings.api_v1_prefix}/content", tags=["content"]
-)
+for _module, _path, _tag in _ROUTERS:
+    app.include_router(
+        _module.router, prefix=f"{settings.api_v1_prefix}/{_path}", tags=[_tag]
+    )
 
 
 # Exception handlers
 @app.exception_handler(ValueError)
 async def value_error_handler(request, exc):
     """Handle ValueError exceptions."""
-    return JSONResponse(status_code=400, content={"detail": str(exc)})
+    return ORJSONResponse(status_code=400, content={"detail": str(exc)})
 
 
 @app.exception_handler(Exception)
 async def generic_exception_handler(request, exc):
     """Handle uncaught exceptions."""
     logger.error(f"Uncaught exception: {str(exc)}", exc_info=True)
-    return JSONResponse(status_code=500, content={"detail": "Internal server error"})
+    return ORJSONResponse(status_code=500, content={"detail": "Internal server error"})
 
 
 if __name__ == "__main__":
@@ -3,6 +3,8 @@ Database models package.
 
 All SQLAlchemy models are exported from this module for easy imports.
 """
+from sqlalchemy.orm import configure_mappers
+
 from app.models.user import User
 from app.models.video import Video
 from app.models.transcript import Transcript
@@ -47,6 +49,10 @@ from app.models.notification import (
     NotificationDelivery,
 )
 
+# Resolve relationships now that every model is imported, so the first query in
+# a worker or request does not pay for mapper configuration
+configure_mappers()
+
 __all__ = [
     "User",
     "Video",
@@ -1,14 +1,13 @@
 """
 Admin audit log for monitoring chat/message activity.
 """
-import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, LargeBinary, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.orm import relationship
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class AdminAuditLog(Base):
@@ -18,7 +17,7 @@ class AdminAuditLog(Base):
 
     __tablename__ = "admin_audit_logs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     event_type = Column(String(50), nullable=False, index=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
     conversation_id = Column(
@@ -32,7 +31,7 @@ class AdminAuditLog(Base):
     output_tokens = Column(Integer, nullable=True)
     flags = Column(ARRAY(String), nullable=True)
     message_metadata = Column(JSONB, nullable=True)
-    ip_hash = Column(String(128), nullable=True)
+    ip_hash = Column(LargeBinary(32), nullable=True)  # raw SHA-256 digest
     user_agent = Column(String(255), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
@@ -40,6 +39,16 @@ class AdminAuditLog(Base):
     conversation = relationship("Conversation")
     message = relationship("Message")
 
+    __table_args__ = (
+        # Serves the admin "has flags" audit view (newest first) without
+        # scanning unflagged rows
+        Index(
+            "idx_audit_flagged_created",
+            "created_at",
+            postgresql_where=text("cardinality(flags) > 0"),
+        ),
+    )
+
     def __repr__(self):
         return (
             f"<AdminAuditLog(id={self.id}, event_type={self.event_type}, "
@@ -1,7 +1,6 @@
 """
 Chunk model for storing transcript chunks with contextual enrichment.
 """
-import uuid
 from datetime import datetime
 from sqlalchemy import (
     Column,
@@ -17,7 +16,16 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
+
+
+def _compute_text_bytes(context) -> int:
+    """UTF-8 size of text + chunk_summary + embedding_text for a new chunk row."""
+    params = context.get_current_parameters()
+    return sum(
+        len((params.get(key) or "").encode("utf-8"))
+        for key in ("text", "chunk_summary", "embedding_text")
+    )
 
 
 class Chunk(Base):
@@ -30,7 +38,7 @@ class Chunk(Base):
 
     __tablename__ = "chunks"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     video_id = Column(
         UUID(as_uuid=True),
         ForeignKey("videos.id", ondelete="CASCADE"),
@@ -87,6 +95,13 @@ class Chunk(Base):
     )  # Whether chunk is in vector DB
     indexed_at = Column(DateTime, nullable=True)
 
+    # Precomputed storage size so usage queries can SUM a column instead of
+    # evaluating length() on three text columns per row. Chunks are written
+    # once (reprocessing deletes and recreates them), so insert-time is enough.
+    text_bytes = Column(
+        Integer, nullable=False, default=_compute_text_bytes, server_default="0"
+    )
+
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     enriched_at = Column(
@@ -102,7 +117,19 @@ class Chunk(Base):
 
     # Indexes for efficient querying
     __table_args__ = (
-        Index("idx_chunk_video_index", "video_id", "chunk_index"),
+        # Covers per-video chunk listings (timestamps/title) and text_bytes sums
+        # with index-only scans
+        Index(
+            "idx_chunk_video_index",
+            "video_id",
+            "chunk_index",
+            postgresql_include=[
+                "start_timestamp",
+                "end_timestamp",
+                "chunk_title",
+                "text_bytes",
+            ],
+        ),
         Index("idx_chunk_user_video", "user_id", "video_id"),
         Index("idx_chunk_timestamps", "start_timestamp", "end_timestamp"),
     )
@@ -113,16 +140,12 @@ class Chunk(Base):
     @property
     def timestamp_display(self) -> str:
         """Format timestamps as MM:SS or HH:MM:SS."""
-        start_mins = int(self.start_timestamp // 60)
-        start_secs = int(self.start_timestamp % 60)
-        end_mins = int(self.end_timestamp // 60)
-        end_secs = int(self.end_timestamp % 60)
+        start_mins, start_secs = divmod(int(self.start_timestamp), 60)
+        end_mins, end_secs = divmod(int(self.end_timestamp), 60)
 
         if start_mins >= 60:
-            start_hours = start_mins // 60
-            start_mins = start_mins % 60
-            end_hours = end_mins // 60
-            end_mins = end_mins % 60
+            start_hours, start_mins = divmod(start_mins, 60)
+            end_hours, end_mins = divmod(end_mins, 60)
             return f"{start_hours:02d}:{start_mins:02d}:{start_secs:02d} - {end_hours:02d}:{end_mins:02d}:{end_secs:02d}"
 
         return f"{start_mins:02d}:{start_secs:02d} - {end_mins:02d}:{end_secs:02d}"
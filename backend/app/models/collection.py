@@ -1,7 +1,6 @@
 """
 Collection models for organizing videos into playlists/groups.
 """
-import uuid
 from datetime import datetime
 from sqlalchemy import (
     Column,
@@ -17,7 +16,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class Collection(Base):
@@ -25,7 +24,7 @@ class Collection(Base):
 
     __tablename__ = "collections"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
@@ -73,7 +72,7 @@ class CollectionVideo(Base):
 
     __tablename__ = "collection_videos"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     collection_id = Column(
         UUID(as_uuid=True),
         ForeignKey("collections.id", ondelete="CASCADE"),
@@ -90,7 +89,10 @@ class CollectionVideo(Base):
     # Metadata
     added_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     added_by_user_id = Column(
-        UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
     )
     position = Column(Integer, nullable=True)  # For custom ordering within collection
 
@@ -113,7 +115,7 @@ class CollectionMember(Base):
 
     __tablename__ = "collection_members"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     collection_id = Column(
         UUID(as_uuid=True),
         ForeignKey("collections.id", ondelete="CASCADE"),
@@ -133,7 +135,10 @@ class CollectionMember(Base):
     # Metadata
     added_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     added_by_user_id = Column(
-        UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
     )
 
     # Relationships
@@ -12,7 +12,6 @@ Enhanced with multi-factor scoring based on OpenAI/Anthropic memory best practic
 - access_count: How often this fact has been recalled
 """
 
-import uuid
 from datetime import datetime
 from enum import Enum
 
@@ -29,7 +28,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class FactCategory(str, Enum):
@@ -44,7 +43,7 @@ class FactCategory(str, Enum):
 class ConversationFact(Base):
     __tablename__ = "conversation_facts"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     conversation_id = Column(
         UUID(as_uuid=True),
         ForeignKey("conversations.id", ondelete="CASCADE"),
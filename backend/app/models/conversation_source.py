@@ -4,13 +4,21 @@ Conversation sources model.
 Tracks which videos/transcripts are attached to a conversation and whether they are
 currently selected for retrieval.
 """
-import uuid
 from datetime import datetime
-from sqlalchemy import Column, DateTime, ForeignKey, Boolean, String, UniqueConstraint
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Boolean,
+    Index,
+    String,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class ConversationSource(Base):
@@ -27,9 +35,17 @@ class ConversationSource(Base):
             "video_id",
             name="uq_conversation_sources_conversation_video",
         ),
+        # Selected-scope lookups (chat retrieval, conversation list) read only
+        # the selected video IDs per conversation
+        Index(
+            "idx_conv_sources_selected",
+            "conversation_id",
+            "video_id",
+            postgresql_where=text("is_selected"),
+        ),
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     conversation_id = Column(
         UUID(as_uuid=True),
         ForeignKey("conversations.id", ondelete="CASCADE"),
@@ -91,6 +91,7 @@ class DiscoveredContent(Base):
         UUID(as_uuid=True),
         ForeignKey("discovery_sources.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
     )
 
     # Content preview (not yet fully imported)
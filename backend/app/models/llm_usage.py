@@ -106,6 +106,7 @@ class LLMUsageEvent(Base):
         UUID(as_uuid=True),
         ForeignKey("messages.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
     )
 
     # Call classification
@@ -149,6 +149,7 @@ class NotificationDelivery(Base):
         UUID(as_uuid=True),
         ForeignKey("notifications.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     channel = Column(String(50), nullable=False)  # in_app, email, push, slack
 
@@ -87,6 +87,12 @@ class Video(Base):
     )  # Source of transcript: "captions" or "whisper"
     chunk_count = Column(Integer, default=0, nullable=False)  # Number of chunks created
 
+    # Storage sizes, recorded when processing completes (NULL until then)
+    transcript_bytes = Column(BigInteger, nullable=True)  # Transcript file or text size
+    chunk_bytes = Column(
+        BigInteger, nullable=True
+    )  # Sum of chunk text + chunk_summary + embedding_text
+
     # Video-level summary (for two-level retrieval)
     summary = Column(Text, nullable=True)  # LLM-generated summary (200-500 words)
     key_topics = Column(
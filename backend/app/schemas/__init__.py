@@ -9,6 +9,7 @@ from app.schemas.video import (
     VideoDeleteRequest,
     VideoDeleteResponse,
     VideoDeleteBreakdown,
+    CleanupOption,
     VideoCancelRequest,
     VideoCancelResponse,
     CleanupSummary,
@@ -109,6 +110,9 @@ from app.schemas.subscription import (
     CustomerPortalResponse,
     QuotaUsage,
     PricingTier,
+    StripeEventBatchRequest,
+    StripeEventResult,
+    StripeEventBatchResponse,
 )
 
 # Discovery schemas
@@ -167,6 +171,7 @@ __all__ = [
     "VideoDeleteRequest",
     "VideoDeleteResponse",
     "VideoDeleteBreakdown",
+    "CleanupOption",
     "VideoCancelRequest",
     "VideoCancelResponse",
     "CleanupSummary",
@@ -259,6 +264,9 @@ __all__ = [
     "CustomerPortalResponse",
     "QuotaUsage",
     "PricingTier",
+    "StripeEventBatchRequest",
+    "StripeEventResult",
+    "StripeEventBatchResponse",
     # Discovery
     "YouTubeSearchRequest",
     "YouTubeSearchResult",
@@ -127,3 +127,28 @@ class PricingTier(BaseModel):
     message_limit: int
     storage_limit_mb: int
     minutes_limit: int
+
+
+# Stripe event replay
+class StripeEventBatchRequest(BaseModel):
+    """Request to (re)process a batch of Stripe events by ID."""
+    event_ids: list[str] = Field(
+        ..., min_length=1, max_length=100, description="Stripe event IDs (evt_...)"
+    )
+
+
+class StripeEventResult(BaseModel):
+    """Outcome of processing a single Stripe event."""
+    event_id: str
+    event_type: Optional[str] = None
+    success: bool
+    dedup: bool = False  # Already processed (claimed by an earlier delivery)
+    error: Optional[str] = None
+
+
+class StripeEventBatchResponse(BaseModel):
+    """Per-event results for a batch replay."""
+    processed: int
+    failed: int
+    skipped: int = 0
+    results: list[StripeEventResult]
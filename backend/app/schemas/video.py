@@ -1,10 +1,15 @@
 """
 Pydantic schemas for video-related API endpoints.
 """
+from enum import Enum
 from typing import Optional, List, Dict
 from datetime import datetime
 from uuid import UUID
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field, field_validator
+
+_BYTES_PER_MB = 1 << 20
+# Estimated Qdrant footprint per indexed chunk (vector + payload)
+_VECTOR_BYTES_PER_CHUNK = 5 * 1024
 
 
 # Request schemas
@@ -51,14 +56,10 @@ class VideoDetail(BaseModel):
         default=None, description="Source of transcript: 'captions' (YouTube) or 'whisper'"
     )
     audio_file_size_mb: Optional[float] = None
-    transcript_size_mb: Optional[float] = None
-    chunk_storage_mb: Optional[float] = Field(
-        default=None, description="Database storage for this video's chunks (MB)"
-    )
-    vector_storage_mb: Optional[float] = Field(
-        default=None, description="Estimated Qdrant vector storage (MB)"
-    )
-    storage_total_mb: Optional[float] = None
+
+    # Persisted storage sizes (inputs for the *_mb fields below)
+    transcript_bytes: Optional[int] = Field(default=None, exclude=True)
+    chunk_bytes: Optional[int] = Field(default=None, exclude=True)
 
     # Timestamps
     created_at: datetime
@@ -68,6 +69,33 @@ class VideoDetail(BaseModel):
     class Config:
         from_attributes = True
 
+    @computed_field
+    @property
+    def transcript_size_mb(self) -> float:
+        return round((self.transcript_bytes or 0) / _BYTES_PER_MB, 3)
+
+    @computed_field(description="Database storage for this video's chunks (MB)")
+    @property
+    def chunk_storage_mb(self) -> float:
+        return round((self.chunk_bytes or 0) / _BYTES_PER_MB, 3)
+
+    @computed_field(description="Estimated Qdrant vector storage (MB)")
+    @property
+    def vector_storage_mb(self) -> float:
+        return round(self.chunk_count * _VECTOR_BYTES_PER_CHUNK / _BYTES_PER_MB, 3)
+
+    @computed_field
+    @property
+    def storage_total_mb(self) -> float:
+        # Audio is not retained, so total is transcript + chunks + vectors.
+        # Sum integer bytes and convert once rather than adding rounded MB.
+        total_bytes = (
+            (self.transcript_bytes or 0)
+            + (self.chunk_bytes or 0)
+            + self.chunk_count * _VECTOR_BYTES_PER_CHUNK
+        )
+        return round(total_bytes / _BYTES_PER_MB, 3)
+
 
 class VideoList(BaseModel):
     """List of videos."""
@@ -156,14 +184,33 @@ class VideoDeleteResponse(BaseModel):
 
 
 # Cancel schemas
+class CleanupOption(str, Enum):
+    """Options for cleanup after cancellation."""
+
+    KEEP_VIDEO = "keep_video"  # Set status to canceled, keep video record
+    FULL_DELETE = "full_delete"  # Hard delete video and all related data
+
+
+def _normalize_cleanup_option(value):
+    """Accept case/whitespace variants like ' Keep_Video '."""
+    if isinstance(value, str):
+        return value.strip().lower()
+    return value
+
+
 class VideoCancelRequest(BaseModel):
     """Request to cancel a video's processing."""
 
-    cleanup_option: str = Field(
-        default="keep_video",
+    cleanup_option: CleanupOption = Field(
+        default=CleanupOption.KEEP_VIDEO,
         description="How to handle the video after cancellation: 'keep_video' (status=canceled) or 'full_delete' (remove record)",
     )
 
+    @field_validator("cleanup_option", mode="before")
+    @classmethod
+    def normalize_cleanup_option(cls, value):
+        return _normalize_cleanup_option(value)
+
     class Config:
         json_schema_extra = {
             "example": {"cleanup_option": "keep_video"}
@@ -218,11 +265,16 @@ class BulkCancelRequest(BaseModel):
     """Request to cancel multiple videos."""
 
     video_ids: List[UUID]
-    cleanup_option: str = Field(
-        default="keep_video",
+    cleanup_option: CleanupOption = Field(
+        default=CleanupOption.KEEP_VIDEO,
         description="How to handle the videos after cancellation: 'keep_video' or 'full_delete'",
     )
 
+    @field_validator("cleanup_option", mode="before")
+    @classmethod
+    def normalize_cleanup_option(cls, value):
+        return _normalize_cleanup_option(value)
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -11,10 +11,11 @@ from sqlalchemy.orm import Session
 from app.models import AdminAuditLog, Message
 
 
-def _hash_ip(ip: Optional[str]) -> Optional[str]:
+def _hash_ip(ip: Optional[str]) -> Optional[bytes]:
     if not ip:
         return None
-    return hashlib.sha256(ip.encode("utf-8")).hexdigest()
+    # Raw 32-byte digest; the admin API renders it as hex
+    return hashlib.sha256(ip.encode("utf-8")).digest()
 
 
 def _extract_flags(metadata: Optional[dict]) -> List[str]:
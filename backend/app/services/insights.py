@@ -20,6 +20,7 @@ import numpy as np
 
 from sqlalchemy.orm import Session
 
+from app.db.base import uuid7
 from app.models import Chunk, Video, ConversationInsight
 from app.services.llm_providers import Message, LLMService
 
@@ -1522,7 +1523,7 @@ class ConversationInsightsService:
             return existing, False
 
         new_row = ConversationInsight(
-            id=uuid.uuid4(),
+            id=uuid7(),
             conversation_id=conversation_id,
             user_id=user_id,
             video_ids=canonical_video_ids,
@@ -7,9 +7,9 @@ Handles:
 - Supporting both "keep_video" (status=canceled) and "full_delete" options
 """
 
+import logging
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
 from pathlib import Path
 from typing import Optional
 from uuid import UUID
@@ -19,15 +19,11 @@ from celery.result import AsyncResult
 from sqlalchemy.orm import Session
 
 from app.models import Video, Transcript, Chunk, Job, CollectionVideo
+from app.schemas.video import CleanupOption
 from app.services.vector_store import vector_store_service
 from app.services.storage_calculator import BYTES_PER_VECTOR
 
-
-class CleanupOption(str, Enum):
-    """Options for cleanup after cancellation."""
-
-    KEEP_VIDEO = "keep_video"  # Set status to canceled, keep video record
-    FULL_DELETE = "full_delete"  # Hard delete video and all related data
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -98,7 +94,7 @@ def revoke_celery_task(task_id: str, terminate: bool = False) -> bool:
 
         return False
     except Exception as e:
-        print(f"[cancel] Error revoking task {task_id}: {e}")
+        logger.warning(f"[cancel] Error revoking task {task_id}: {e}")
         return False
 
 
@@ -137,16 +133,7 @@ def cleanup_video_data(
         try:
             # Get total text bytes from chunks
             chunk_storage = (
-                db.query(
-                    func.coalesce(
-                        func.sum(
-                            func.length(Chunk.text)
-                            + func.coalesce(func.length(Chunk.chunk_summary), 0)
-                            + func.coalesce(func.length(Chunk.embedding_text), 0)
-                        ),
-                        0,
-                    )
-                )
+                db.query(func.coalesce(func.sum(Chunk.text_bytes), 0))
                 .filter(Chunk.video_id == video.id)
                 .scalar()
                 or 0
@@ -161,7 +148,7 @@ def cleanup_video_data(
                 or 0
             )
         except Exception as e:
-            print(f"[cleanup] Error calculating chunk storage for video {video.id}: {e}")
+            logger.warning(f"[cleanup] Error calculating chunk storage for video {video.id}: {e}")
 
     # 1. Delete vectors from Qdrant
     if delete_vectors:
@@ -171,7 +158,7 @@ def cleanup_video_data(
             # Estimate vector storage freed
             storage_freed_bytes += indexed_chunk_count * BYTES_PER_VECTOR
         except Exception as e:
-            print(f"[cleanup] Error deleting vectors for video {video.id}: {e}")
+            logger.warning(f"[cleanup] Error deleting vectors for video {video.id}: {e}")
 
     # 2. Delete chunk records from DB
     if delete_db_records:
@@ -185,7 +172,7 @@ def cleanup_video_data(
             # Add text storage freed
             storage_freed_bytes += chunk_text_bytes
         except Exception as e:
-            print(f"[cleanup] Error deleting chunks for video {video.id}: {e}")
+            logger.warning(f"[cleanup] Error deleting chunks for video {video.id}: {e}")
 
     # 3. Delete transcript record from DB
     if delete_db_records:
@@ -197,7 +184,7 @@ def cleanup_video_data(
                 db.delete(transcript)
                 summary.transcript_deleted = True
         except Exception as e:
-            print(f"[cleanup] Error deleting transcript for video {video.id}: {e}")
+            logger.warning(f"[cleanup] Error deleting transcript for video {video.id}: {e}")
 
     # 4. Delete audio file
     if delete_files and video.audio_file_path:
@@ -212,7 +199,7 @@ def cleanup_video_data(
             if audio_path.parent.exists() and not any(audio_path.parent.iterdir()):
                 audio_path.parent.rmdir()
         except Exception as e:
-            print(f"[cleanup] Error deleting audio file for video {video.id}: {e}")
+            logger.warning(f"[cleanup] Error deleting audio file for video {video.id}: {e}")
 
     # 5. Delete transcript JSON file
     if delete_files and video.transcript_file_path:
@@ -229,7 +216,7 @@ def cleanup_video_data(
             ):
                 transcript_path.parent.rmdir()
         except Exception as e:
-            print(
+            logger.warning(
                 f"[cleanup] Error deleting transcript file for video {video.id}: {e}"
             )
 
@@ -251,11 +238,11 @@ def cleanup_video_data(
                     "vectors_deleted": summary.vectors_deleted,
                 },
             )
-            print(
+            logger.info(
                 f"[cleanup] Credited {summary.storage_freed_mb:.2f} MB back to user {video.user_id}"
             )
         except Exception as e:
-            print(f"[cleanup] Error crediting storage back for video {video.id}: {e}")
+            logger.warning(f"[cleanup] Error crediting storage back for video {video.id}: {e}")
 
     # Clear file path references on video
     video.audio_file_path = None
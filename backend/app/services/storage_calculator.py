@@ -4,6 +4,7 @@ Storage calculator service for comprehensive billing.
 Calculates storage usage across PostgreSQL database and Qdrant vectors
 for accurate billing based on actual storage footprint.
 """
+import os
 from uuid import UUID
 
 from sqlalchemy import func, String
@@ -15,6 +16,7 @@ from app.models import (
     ConversationFact,
     ConversationInsight,
     Conversation,
+    Transcript,
     Video,
 )
 
@@ -79,19 +81,10 @@ class StorageCalculator:
         """
         total_bytes = 0
 
-        # Chunk storage: text + summary + embedding_text
+        # Chunk storage: text + summary + embedding_text (precomputed per row)
         # Only count chunks from non-deleted videos
         chunk_bytes = (
-            self.db.query(
-                func.coalesce(
-                    func.sum(
-                        func.length(Chunk.text)
-                        + func.coalesce(func.length(Chunk.chunk_summary), 0)
-                        + func.coalesce(func.length(Chunk.embedding_text), 0)
-                    ),
-                    0,
-                )
-            )
+            self.db.query(func.coalesce(func.sum(Chunk.text_bytes), 0))
             .join(Video, Chunk.video_id == Video.id)
             .filter(Chunk.user_id == user_id, Video.is_deleted.is_(False))
             .scalar()
@@ -191,3 +184,37 @@ class StorageCalculator:
             "vector_mb": round(vector_mb, 3),
             "total_mb": round(database_mb + vector_mb, 3),
         }
+
+
+def refresh_video_storage_bytes(db: Session, video: Video) -> None:
+    """
+    Persist a video's transcript and chunk storage sizes on the Video row.
+
+    Called once when processing finishes so list/detail endpoints can read
+    the sizes instead of re-aggregating chunks and stat()-ing files per request.
+    Does not commit.
+
+    Transcript size prefers the file on disk, falling back to the stored text.
+    Chunk size sums text + chunk_summary + embedding_text, matching
+    calculate_database_storage_mb.
+    """
+    transcript_bytes = None
+    if video.transcript_file_path and os.path.exists(video.transcript_file_path):
+        transcript_bytes = os.path.getsize(video.transcript_file_path)
+    if transcript_bytes is None:
+        full_text = (
+            db.query(Transcript.full_text)
+            .filter(Transcript.video_id == video.id)
+            .scalar()
+        )
+        transcript_bytes = len(full_text.encode("utf-8")) if full_text else 0
+
+    chunk_bytes = (
+        db.query(func.coalesce(func.sum(Chunk.text_bytes), 0))
+        .filter(Chunk.video_id == video.id)
+        .scalar()
+        or 0
+    )
+
+    video.transcript_bytes = transcript_bytes
+    video.chunk_bytes = chunk_bytes
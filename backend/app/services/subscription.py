@@ -9,8 +9,10 @@ Handles:
 - Webhook event processing
 """
 import uuid
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Dict, Any
+import orjson
 import stripe
 from sqlalchemy.orm import Session
 from sqlalchemy import func
@@ -678,25 +680,43 @@ class SubscriptionService:
         Returns:
             List of PricingTier objects
         """
-        tiers = []
-        for tier_name, config in PRICING_TIERS.items():
-            tiers.append(
-                PricingTier(
-                    tier=tier_name,
-                    name=config["name"],
-                    price_monthly=config["price_monthly"],
-                    price_yearly=config["price_yearly"],
-                    stripe_price_id_monthly=config.get("stripe_price_id_monthly", ""),
-                    stripe_price_id_yearly=config.get("stripe_price_id_yearly", ""),
-                    features=config["features"],
-                    video_limit=config["video_limit"],
-                    document_limit=config["document_limit"],
-                    message_limit=config["message_limit"],
-                    storage_limit_mb=config["storage_limit_mb"],
-                    minutes_limit=config["minutes_limit"],
-                )
-            )
-        return tiers
+        return list(_build_pricing_tiers())
+
+    def get_pricing_tiers_json(self) -> bytes:
+        """
+        Get all pricing tiers as a serialized JSON array.
+
+        Returns:
+            JSON bytes, built once per process
+        """
+        return _pricing_tiers_json()
+
+
+@lru_cache(maxsize=1)
+def _build_pricing_tiers() -> tuple:
+    """Build PricingTier objects once; PRICING_TIERS is static module data."""
+    return tuple(
+        PricingTier(
+            tier=tier_name,
+            name=config["name"],
+            price_monthly=config["price_monthly"],
+            price_yearly=config["price_yearly"],
+            stripe_price_id_monthly=config.get("stripe_price_id_monthly", ""),
+            stripe_price_id_yearly=config.get("stripe_price_id_yearly", ""),
+            features=config["features"],
+            video_limit=config["video_limit"],
+            document_limit=config["document_limit"],
+            message_limit=config["message_limit"],
+            storage_limit_mb=config["storage_limit_mb"],
+            minutes_limit=config["minutes_limit"],
+        )
+        for tier_name, config in PRICING_TIERS.items()
+    )
+
+
+@lru_cache(maxsize=1)
+def _pricing_tiers_json() -> bytes:
+    return orjson.dumps([tier.model_dump(mode="json") for tier in _build_pricing_tiers()])
 
 
 # Global service instance
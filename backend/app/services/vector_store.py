@@ -4,6 +4,7 @@ Vector store service for indexing and searching transcript chunks.
 Provides abstraction over vector databases (currently Qdrant, could support pgvector later).
 Handles embedding storage, similarity search, and filtering.
 """
+import logging
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
@@ -18,12 +19,15 @@ from qdrant_client.models import (
     PointStruct,
     Filter,
     FieldCondition,
+    MatchAny,
     MatchValue,
 )
 
 from app.core.config import settings
 from app.services.enrichment import EnrichedChunk
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ScoredChunk:
@@ -112,6 +116,11 @@ class VectorStore(ABC):
         """Delete all chunks for a video."""
         pass
 
+    def delete_by_video_ids(self, video_ids: Sequence[UUID]):
+        """Delete all chunks for several videos (override to batch)."""
+        for video_id in video_ids:
+            self.delete_by_video_id(video_id)
+
     @abstractmethod
     def get_stats(self) -> Dict:
         """Get collection statistics."""
@@ -173,9 +182,9 @@ class QdrantVectorStore(VectorStore):
                     size=dimensions, distance=Distance.COSINE  # Cosine similarity
                 ),
             )
-            print(f"Created Qdrant collection: {self.collection_name}")
+            logger.info(f"Created Qdrant collection: {self.collection_name}")
         else:
-            print(f"Qdrant collection already exists: {self.collection_name}")
+            logger.info(f"Qdrant collection already exists: {self.collection_name}")
 
     def index_chunks(
         self,
@@ -254,7 +263,7 @@ class QdrantVectorStore(VectorStore):
             batch = points[i : i + BATCH_SIZE]
             self.client.upsert(collection_name=self.collection_name, points=batch)
 
-        print(f"Indexed {len(points)} chunks for {'document' if content_type != 'youtube' else 'video'} {video_id}")
+        logger.info(f"Indexed {len(points)} chunks for {'document' if content_type != 'youtube' else 'video'} {video_id}")
 
     def search_with_diversity(
         self,
@@ -747,7 +756,31 @@ class QdrantVectorStore(VectorStore):
             ),
         )
 
-        print(f"Deleted chunks for video {video_id}")
+        logger.info(f"Deleted chunks for video {video_id}")
+
+    def delete_by_video_ids(self, video_ids: Sequence[UUID]):
+        """
+        Delete all chunks for several videos in a single request.
+
+        Args:
+            video_ids: Video IDs
+        """
+        if not video_ids:
+            return
+
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=Filter(
+                must=[
+                    FieldCondition(
+                        key="video_id",
+                        match=MatchAny(any=[str(vid) for vid in video_ids]),
+                    )
+                ]
+            ),
+        )
+
+        logger.info(f"Deleted chunks for {len(video_ids)} videos")
 
     def get_stats(self) -> Dict:
         """
@@ -998,6 +1031,15 @@ class VectorStoreService:
         """
         self.vector_store.delete_by_video_id(video_id)
 
+    def delete_videos(self, video_ids: Sequence[UUID]):
+        """
+        Delete all chunks for several videos.
+
+        Args:
+            video_ids: Video IDs
+        """
+        self.vector_store.delete_by_video_ids(video_ids)
+
     def get_stats(self) -> Dict:
         """Get vector store statistics."""
         return self.vector_store.get_stats()
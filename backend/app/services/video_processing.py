@@ -54,6 +54,8 @@ def reset_video_processing(
     video.error_message = None
     video.completed_at = None
     video.chunk_count = 0
+    video.transcript_bytes = None
+    video.chunk_bytes = None
     video.transcription_language = None
     video.transcription_model = None
 
@@ -4,8 +4,11 @@ YouTube video downloader service using yt-dlp.
 Handles downloading audio from YouTube videos and extracting metadata.
 Supports caption extraction for faster transcription when available.
 """
+import copy
 import logging
 import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Tuple, List
@@ -48,6 +51,12 @@ class YouTubeService:
             "Origin": "https://www.youtube.com",
             "Referer": "https://www.youtube.com",
         }
+        # TTL cache for metadata lookups, keyed on YouTube video ID so retries
+        # and URL variants (?t=, &feature=, youtu.be) skip the network round trip
+        self._info_cache: dict = {}
+        self._info_cache_ttl: int = 600  # 10 minutes
+        self._info_cache_max_size: int = 4096
+        self._info_cache_lock = threading.Lock()
 
     def _normalize_url(self, url: str) -> str:
         """
@@ -122,6 +131,8 @@ class YouTubeService:
         patterns = [
             # Standard watch + short youtu.be links
             r"(?:youtube\.com/(?:watch\?v=|shorts/|live/)|youtu\.be/)([^&\n?#/]+)",
+            # Watch URLs where v= is not the first query param
+            r"youtube\.com/watch\?(?:[^#\n]*&)?v=([^&\n?#/]+)",
             # Embed URLs
             r"youtube\.com/embed/([^&\n?#/]+)",
             # Legacy /v URLs
@@ -148,8 +159,28 @@ class YouTubeService:
         Raises:
             YouTubeDownloadError: If metadata extraction fails
         """
-        normalized_url = self._normalize_url(url)
+        video_id = self.extract_video_id(url)
+        now = time.time()
+
+        with self._info_cache_lock:
+            cached = self._info_cache.get(video_id)
+        if cached and (now - cached[1]) < self._info_cache_ttl:
+            logger.debug(f"Video info cache hit for {video_id}")
+            return copy.deepcopy(cached[0])
+
+        metadata = self._fetch_video_info(f"https://www.youtube.com/watch?v={video_id}")
+
+        with self._info_cache_lock:
+            if video_id not in self._info_cache and len(self._info_cache) >= self._info_cache_max_size:
+                # Evict oldest entry
+                oldest_key = min(self._info_cache, key=lambda k: self._info_cache[k][1])
+                del self._info_cache[oldest_key]
+            self._info_cache[video_id] = (metadata, now)
+
+        return copy.deepcopy(metadata)
 
+    def _fetch_video_info(self, normalized_url: str) -> Dict:
+        """Run yt-dlp metadata extraction for a canonical watch URL."""
         ydl_opts = {
             "quiet": True,
             "no_warnings": True,
@@ -404,9 +404,9 @@ def _find_heavy_users(db):
 
     cutoff = datetime.utcnow() - timedelta(days=30)
 
-    # Get active paid users
+    # Get active paid users (only the columns the report needs)
     paid_users = (
-        db.query(User)
+        db.query(User.id, User.email, User.subscription_tier)
         .filter(
             User.subscription_tier.in_(["pro", "enterprise"]),
             User.subscription_status == "active",
@@ -418,6 +418,29 @@ def _find_heavy_users(db):
     if not paid_users:
         return {"users_checked": 0, "heavy_users": []}
 
+    user_ids = [user.id for user in paid_users]
+
+    # Message/video counts for all users in one grouped query instead of
+    # two COUNT queries per user
+    event_counts = {}
+    for user_id, event_type, count in (
+        db.query(UsageEvent.user_id, UsageEvent.event_type, func.count(UsageEvent.id))
+        .filter(
+            UsageEvent.user_id.in_(user_ids),
+            UsageEvent.event_type.in_(["chat_message_sent", "video_ingested"]),
+            UsageEvent.event_timestamp >= cutoff,
+        )
+        .group_by(UsageEvent.user_id, UsageEvent.event_type)
+    ):
+        event_counts[(user_id, event_type)] = count
+
+    # Storage from UserQuota, also fetched in one query
+    storage_mb_by_user = dict(
+        db.query(UserQuota.user_id, UserQuota.storage_mb_used)
+        .filter(UserQuota.user_id.in_(user_ids))
+        .all()
+    )
+
     heavy_users = []
 
     for user in paid_users:
@@ -426,31 +449,10 @@ def _find_heavy_users(db):
         if not thresholds:
             continue
 
-        # Count messages in last 30 days
-        message_count = (
-            db.query(func.count(UsageEvent.id))
-            .filter(
-                UsageEvent.user_id == user.id,
-                UsageEvent.event_type == "chat_message_sent",
-                UsageEvent.event_timestamp >= cutoff,
-            )
-            .scalar()
-        ) or 0
-
-        # Count videos processed in last 30 days
-        video_count = (
-            db.query(func.count(UsageEvent.id))
-            .filter(
-                UsageEvent.user_id == user.id,
-                UsageEvent.event_type == "video_ingested",
-                UsageEvent.event_timestamp >= cutoff,
-            )
-            .scalar()
-        ) or 0
-
-        # Get storage from UserQuota
-        quota = db.query(UserQuota).filter(UserQuota.user_id == user.id).first()
-        storage_gb = float(quota.storage_mb_used) / 1024.0 if quota else 0.0
+        message_count = event_counts.get((user.id, "chat_message_sent"), 0)
+        video_count = event_counts.get((user.id, "video_ingested"), 0)
+        storage_mb = storage_mb_by_user.get(user.id)
+        storage_gb = float(storage_mb) / 1024.0 if storage_mb is not None else 0.0
 
         # Check thresholds
         breaches = []
@@ -0,0 +1,148 @@
+"""
+Celery tasks for Stripe subscription events.
+
+The webhook endpoint only verifies the signature and enqueues the event here,
+so Stripe gets its 200 immediately and DB/Stripe API work happens on the
+dedicated "webhooks" queue instead of the API event loop.
+"""
+import logging
+from typing import Any, Dict, Optional
+
+import redis
+
+from app.core.celery_app import celery_app
+from app.db.base import SessionLocal
+from app.services.subscription import subscription_service
+
+logger = logging.getLogger(__name__)
+
+# Stripe retries deliveries for up to 3 days, but nearly all duplicates arrive
+# within hours; a day of dedup keys keeps Redis small
+_STRIPE_EVENT_DEDUP_TTL_SECONDS = 86400
+_redis_client: Optional[redis.Redis] = None
+
+
+def _get_redis() -> redis.Redis:
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(celery_app.conf.broker_url)
+    return _redis_client
+
+
+def claim_stripe_event(event_id: str) -> bool:
+    """
+    Mark a Stripe event as seen (SET NX with a TTL).
+
+    Returns False if an earlier delivery already claimed the event. Fails open
+    when Redis is unavailable so events are never silently dropped.
+    """
+    try:
+        return bool(
+            _get_redis().set(
+                f"stripe:evt:{event_id}",
+                "1",
+                nx=True,
+                ex=_STRIPE_EVENT_DEDUP_TTL_SECONDS,
+            )
+        )
+    except redis.RedisError as e:
+        logger.warning(f"Stripe event dedup unavailable for {event_id}: {e}")
+        return True
+
+
+def release_stripe_event(event_id: str) -> None:
+    """Drop a claim so Stripe's next retry of the event is processed."""
+    try:
+        _get_redis().delete(f"stripe:evt:{event_id}")
+    except redis.RedisError as e:
+        logger.warning(f"Failed to release Stripe event claim {event_id}: {e}")
+
+
+# Event types that write to the database -> subscription_service method name
+_DB_HANDLERS = {
+    "checkout.session.completed": "handle_checkout_completed",  # Payment successful
+    "customer.subscription.updated": "handle_subscription_updated",  # Status/plan change
+    "customer.subscription.deleted": "handle_subscription_deleted",  # Subscription canceled
+    "invoice.payment_failed": "handle_payment_failed",  # Mark subscription past_due
+}
+
+
+def handle_stripe_event(event_type: str, event_data: Dict[str, Any]) -> None:
+    """
+    Apply a verified Stripe event to the database.
+
+    A session is only opened for event types in _DB_HANDLERS; log-only and
+    unhandled types return without touching the connection pool.
+
+    Raises:
+        KeyError, ValueError, TypeError: Permanent errors (bad data shape)
+        Exception: Anything else is treated as transient by callers
+    """
+    handler_name = _DB_HANDLERS.get(event_type)
+
+    if handler_name is None:
+        if event_type == "customer.subscription.created":
+            # Subscription created (handled by checkout.session.completed)
+            logger.info(f"Subscription created: {event_data['id']}")
+        elif event_type == "invoice.payment_succeeded":
+            # Payment succeeded - subscription renewed
+            logger.info(
+                f"Payment succeeded for subscription: {event_data.get('subscription')}"
+            )
+        else:
+            logger.debug(f"Unhandled Stripe event type: {event_type}")
+        return
+
+    with SessionLocal() as db:
+        getattr(subscription_service, handler_name)(event_data, db)
+
+
+@celery_app.task(bind=True, max_retries=3, default_retry_delay=30, serializer="msgpack")
+def process_stripe_event(
+    self,
+    event_type: str,
+    event_data: Dict[str, Any],
+    event_id: Optional[str] = None,
+):
+    """
+    Process a Stripe webhook event in the background.
+
+    Args:
+        event_type: Stripe event type (e.g. "customer.subscription.updated")
+        event_data: The event's data.object as a plain dict
+        event_id: Stripe event ID whose dedup claim is released if every
+            retry fails, so Stripe's own redelivery is processed
+
+    Uses msgpack rather than JSON: Stripe objects are deeply nested dicts of
+    plain scalars, which msgpack encodes smaller and faster.
+    """
+    try:
+        handle_stripe_event(event_type, event_data)
+        return {"status": "ok", "event_type": event_type}
+
+    except (KeyError, ValueError, TypeError) as e:
+        # Permanent errors (bad data shape) — retrying will not help
+        logger.error(
+            f"Permanent error processing Stripe webhook {event_type}: {str(e)}",
+            exc_info=True,
+        )
+        return {"status": "failed", "event_type": event_type, "error": str(e)}
+
+    except Exception as e:
+        if self.request.retries >= self.max_retries:
+            # Out of retries: the endpoint already returned 200, so let the
+            # next Stripe delivery of this event through instead of dropping it
+            if event_id:
+                release_stripe_event(event_id)
+            logger.error(
+                f"Giving up on Stripe webhook {event_type} ({event_id}) "
+                f"after {self.request.retries} retries: {str(e)}",
+                exc_info=True,
+            )
+            return {"status": "failed", "event_type": event_type, "error": str(e)}
+
+        # Transient errors (DB down, Stripe API hiccup) — retry with backoff
+        logger.warning(
+            f"Transient error processing Stripe webhook {event_type}: {str(e)}"
+        )
+        raise self.retry(exc=e, countdown=30 * (2**self.request.retries))
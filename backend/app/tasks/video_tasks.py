@@ -14,6 +14,7 @@ import logging
 from uuid import UUID
 from pathlib import Path
 from datetime import datetime
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -31,6 +32,7 @@ from app.services.embeddings import (
 )
 from app.services.vector_store import vector_store_service
 from app.services.storage import storage_service
+from app.services.storage_calculator import refresh_video_storage_bytes
 from app.services.usage_tracker import UsageTracker, QuotaExceededError
 from app.core.config import settings
 from app.services.job_cancellation import check_if_canceled
@@ -456,28 +458,34 @@ def _chunk_and_enrich(video_id: str, transcript_id: str):
             chunks, max_workers=5, on_progress=_on_enrich_progress
         )
 
-        for enriched_chunk in enriched_chunks:
-            chunk = enriched_chunk.chunk
-            db_chunk = Chunk(
-                video_id=video_uuid,
-                user_id=video.user_id,
-                chunk_index=chunk.chunk_index,
-                text=chunk.text,
-                token_count=chunk.token_count,
-                start_timestamp=chunk.start_timestamp,
-                end_timestamp=chunk.end_timestamp,
-                duration_seconds=chunk.duration_seconds,
-                speakers=chunk.speakers,
-                chapter_title=chunk.chapter_title,
-                chapter_index=chunk.chapter_index,
-                chunk_summary=enriched_chunk.summary,
-                chunk_title=enriched_chunk.title,
-                keywords=enriched_chunk.keywords,
-                embedding_text=enriched_chunk.embedding_text,
-                enrichment_version=2,
-                enriched_at=datetime.utcnow(),
-            )
-            db.add(db_chunk)
+        # Core executemany instead of one ORM object per chunk: the driver
+        # batches the rows into multi-VALUES INSERTs and nothing is added to
+        # the identity map (the rows are not read back in this session)
+        enriched_at = datetime.utcnow()
+        chunk_rows = [
+            {
+                "video_id": video_uuid,
+                "user_id": video.user_id,
+                "chunk_index": enriched_chunk.chunk.chunk_index,
+                "text": enriched_chunk.chunk.text,
+                "token_count": enriched_chunk.chunk.token_count,
+                "start_timestamp": enriched_chunk.chunk.start_timestamp,
+                "end_timestamp": enriched_chunk.chunk.end_timestamp,
+                "duration_seconds": enriched_chunk.chunk.duration_seconds,
+                "speakers": enriched_chunk.chunk.speakers,
+                "chapter_title": enriched_chunk.chunk.chapter_title,
+                "chapter_index": enriched_chunk.chunk.chapter_index,
+                "chunk_summary": enriched_chunk.summary,
+                "chunk_title": enriched_chunk.title,
+                "keywords": enriched_chunk.keywords,
+                "embedding_text": enriched_chunk.embedding_text,
+                "enrichment_version": 2,
+                "enriched_at": enriched_at,
+            }
+            for enriched_chunk in enriched_chunks
+        ]
+        if chunk_rows:
+            db.execute(insert(Chunk), chunk_rows)
 
         video.chunk_count = len(enriched_chunks)
         video.status = "chunked"
@@ -499,6 +507,18 @@ def _chunk_and_enrich(video_id: str, transcript_id: str):
         db.close()
 
 
+def _record_storage_bytes(db: Session, video_id: UUID):
+    """Persist transcript/chunk storage sizes for list and detail endpoints."""
+    try:
+        video = db.query(Video).filter(Video.id == video_id).first()
+        if video:
+            refresh_video_storage_bytes(db, video)
+            db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"[pipeline] Failed to record storage sizes for video={video_id}: {e}")
+
+
 def _embed_and_index(video_id: str, user_id: str, force_reindex: bool = False):
     """Internal helper to embed and index chunks."""
     db = SessionLocal()
@@ -516,6 +536,7 @@ def _embed_and_index(video_id: str, user_id: str, force_reindex: bool = False):
         chunks = query.order_by(Chunk.chunk_index).all()
 
         if not chunks:
+            _record_storage_bytes(db, video_uuid)
             update_video_status(db, video_uuid, "completed", 100.0)
             return {"indexed_count": 0}
 
@@ -573,6 +594,8 @@ def _embed_and_index(video_id: str, user_id: str, force_reindex: bool = False):
         video.error_message = None
         db.commit()
 
+        _record_storage_bytes(db, video_uuid)
+
         try:
             usage_tracker.track_embedding_generation(
                 user_uuid,
@@ -269,6 +269,18 @@ class TestPricingEndpoint:
             assert "storage_limit_mb" in tier
             assert "minutes_limit" in tier
 
+    def test_pricing_matches_schema(self, client_with_free_user):
+        """The pre-serialized body matches the PricingTier response model."""
+        from app.schemas import PricingTier
+        from app.services.subscription import subscription_service
+
+        response = client_with_free_user.get("/api/v1/subscriptions/pricing")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        expected = [t.model_dump(mode="json") for t in subscription_service.get_pricing_tiers()]
+        assert [PricingTier(**t).model_dump(mode="json") for t in response.json()] == expected
+
 
 class TestVerifyCheckoutEndpoint:
     """Test GET /subscriptions/verify-checkout endpoint."""
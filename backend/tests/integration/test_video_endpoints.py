@@ -238,6 +238,38 @@ def test_ingest_video_validation_failure_returns_400(
         assert "Video is too long" in response.json()["detail"]
 
 
+def test_ingest_duplicate_video_returns_400(
+    client_with_user,
+    db: Session,
+    test_user,
+    mock_youtube_service,
+    mock_celery_task,
+    mock_quota_checks,
+):
+    """Re-ingesting a video the user already has is rejected with its details."""
+    existing = Video(
+        user_id=test_user.id,
+        youtube_id="test123",
+        youtube_url="https://www.youtube.com/watch?v=test123",
+        title="Already Here",
+        status="completed",
+    )
+    db.add(existing)
+    db.commit()
+
+    response = client_with_user.post(
+        "/api/v1/videos/ingest",
+        json={"youtube_url": "https://www.youtube.com/watch?v=test123"},
+    )
+
+    assert response.status_code == 400
+    detail = response.json()["detail"]
+    assert "'Already Here'" in detail
+    assert "status: completed" in detail
+    assert str(existing.id) in detail
+    mock_celery_task.delay.assert_not_called()
+
+
 # Tests for GET /videos
 
 
@@ -257,6 +289,92 @@ def test_list_videos_returns_user_videos(client_with_user, sample_video):
     assert str(sample_video.id) in video_ids
 
 
+def test_list_videos_reports_persisted_storage_sizes(
+    client_with_user, sample_video, db: Session
+):
+    """Storage fields are derived from the sizes persisted on the video."""
+    sample_video.transcript_bytes = 512 * 1024
+    sample_video.chunk_bytes = 1024 * 1024
+    db.commit()
+
+    response = client_with_user.get("/api/v1/videos")
+
+    assert response.status_code == 200
+    video = next(v for v in response.json()["videos"] if v["id"] == str(sample_video.id))
+    assert video["transcript_size_mb"] == 0.5
+    assert video["chunk_storage_mb"] == 1.0
+    assert video["vector_storage_mb"] == round(10 * 5.0 / 1024.0, 3)
+    assert video["storage_total_mb"] == round(0.5 + 1.0 + 0.049, 3)
+    assert "transcript_bytes" not in video
+
+
+def test_video_detail_construct_matches_validated(sample_video, db: Session):
+    """Unvalidated construction serializes identically to model_validate."""
+    from app.api.routes.videos import _to_video_detail
+    from app.schemas import VideoDetail
+
+    sample_video.transcript_bytes = 2048
+    sample_video.chunk_bytes = 4096
+    sample_video.tags = ["a", "b"]
+    sample_video.chapters = [{"title": "Intro", "start_time": 0, "end_time": 10}]
+    db.commit()
+    db.refresh(sample_video)
+
+    assert _to_video_detail(sample_video).model_dump(mode="json") == (
+        VideoDetail.model_validate(sample_video).model_dump(mode="json")
+    )
+
+
+def test_list_videos_returns_304_for_matching_etag(client_with_user, sample_video):
+    """Unchanged library revalidates with 304 Not Modified."""
+    first = client_with_user.get("/api/v1/videos")
+    etag = first.headers["etag"]
+
+    second = client_with_user.get("/api/v1/videos", headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+
+
+def test_list_videos_cached_page_matches_schema(client_with_user, sample_video):
+    """Cached list pages carry the ETag and the same schema-shaped payload."""
+    from app.schemas import VideoList
+
+    first = client_with_user.get("/api/v1/videos")
+    second = client_with_user.get("/api/v1/videos")
+
+    assert second.status_code == 200
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.headers["content-type"] == "application/json"
+    assert second.json() == first.json()
+    VideoList.model_validate(second.json())
+
+
+def test_list_videos_etag_changes_when_library_changes(
+    client_with_user, sample_video, db: Session, test_user
+):
+    """ETag changes when a video is added, so stale pages are not served."""
+    etag = client_with_user.get("/api/v1/videos").headers["etag"]
+
+    db.add(
+        Video(
+            user_id=test_user.id,
+            youtube_id="newvid",
+            youtube_url="https://www.youtube.com/watch?v=newvid",
+            title="New Video",
+            status="pending",
+            progress_percent=0.0,
+        )
+    )
+    db.commit()
+
+    response = client_with_user.get("/api/v1/videos", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["total"] == 2
+
+
 def test_list_videos_with_status_filter(client_with_user, db: Session, test_user):
     """Filtering by status returns only matching videos."""
     # Create videos with different statuses
@@ -419,6 +537,86 @@ def test_delete_videos_soft_deletes(client_with_user, sample_video, db: Session)
     assert sample_video.is_deleted is True
 
 
+def test_delete_videos_bulk_removes_chunks_and_soft_deletes(
+    client_with_user, db: Session, test_user
+):
+    """Bulk delete purges chunks and soft deletes every selected video."""
+    from app.models import Chunk
+
+    videos = [
+        Video(
+            user_id=test_user.id,
+            youtube_id=f"bulk{i}",
+            youtube_url=f"https://www.youtube.com/watch?v=bulk{i}",
+            title=f"Bulk Video {i}",
+            status="completed",
+            progress_percent=100.0,
+            chunk_count=2,
+        )
+        for i in range(3)
+    ]
+    db.add_all(videos)
+    db.flush()
+    for video in videos:
+        for index in range(2):
+            db.add(
+                Chunk(
+                    video_id=video.id,
+                    user_id=test_user.id,
+                    chunk_index=index,
+                    text="chunk text",
+                    token_count=2,
+                    start_timestamp=0.0,
+                    end_timestamp=1.0,
+                    duration_seconds=1.0,
+                )
+            )
+    db.commit()
+
+    with patch("app.api.routes.videos.vector_store_service"):
+        response = client_with_user.post(
+            "/api/v1/videos/delete",
+            json={
+                "video_ids": [str(v.id) for v in videos],
+                "remove_from_library": True,
+                "delete_search_index": True,
+            },
+        )
+
+    assert response.status_code == 200
+    assert response.json()["deleted_count"] == 3
+    assert db.query(Chunk).count() == 0
+    for video in videos:
+        db.refresh(video)
+        assert video.is_deleted is True
+        assert video.deleted_at is not None
+
+
+def test_purging_search_index_resets_chunk_storage(
+    client_with_user, sample_video, db: Session
+):
+    """Purging chunks but keeping the video zeroes the persisted chunk sizes."""
+    sample_video.chunk_bytes = 4096
+    sample_video.chunk_count = 2
+    db.commit()
+
+    with patch("app.api.routes.videos.vector_store_service"):
+        response = client_with_user.post(
+            "/api/v1/videos/delete",
+            json={
+                "video_ids": [str(sample_video.id)],
+                "remove_from_library": False,
+                "delete_search_index": True,
+            },
+        )
+
+    assert response.status_code == 200
+    db.refresh(sample_video)
+    assert sample_video.is_deleted is False
+    assert sample_video.chunk_bytes == 0
+    assert sample_video.chunk_count == 0
+
+
 def test_delete_videos_returns_storage_breakdown(client_with_user, sample_video):
     """Delete response includes storage breakdown."""
     with patch("app.api.routes.videos.vector_store_service"):
@@ -438,6 +636,33 @@ def test_delete_videos_returns_storage_breakdown(client_with_user, sample_video)
     assert "total_size_mb" in breakdown
 
 
+def test_delete_videos_uses_stored_transcript_size(
+    client_with_user, sample_video, db: Session
+):
+    """Transcript size falls back to stored transcript text when no file exists."""
+    from app.models import Transcript
+
+    db.add(
+        Transcript(
+            video_id=sample_video.id,
+            full_text="x" * (1024 * 1024),
+            segments=[],
+            duration_seconds=212,
+        )
+    )
+    db.commit()
+
+    with patch("app.api.routes.videos.vector_store_service"):
+        response = client_with_user.post(
+            "/api/v1/videos/delete",
+            json={"video_ids": [str(sample_video.id)]},
+        )
+
+    assert response.status_code == 200
+    breakdown = response.json()["videos"][0]
+    assert breakdown["transcript_size_mb"] == 1.0
+
+
 def test_delete_empty_list_returns_400(client_with_user):
     """Deleting empty list returns 400."""
     response = client_with_user.post(
@@ -497,6 +722,110 @@ def test_delete_single_video(client_with_user, sample_video, db: Session):
     assert sample_video.is_deleted is True
 
 
+# Tests for POST /videos/cancel-bulk
+
+
+def test_cancel_bulk_reports_per_video_results(client_with_user, db: Session, test_user, sample_video):
+    """Bulk cancel keeps request order and reports missing/terminal videos."""
+    from app.services.job_cancellation import CancelResult, CleanupSummary as ServiceCleanupSummary
+
+    pending = Video(
+        user_id=test_user.id,
+        youtube_id="pending1",
+        youtube_url="https://www.youtube.com/watch?v=pending1",
+        title="Pending Video",
+        status="transcribing",
+    )
+    db.add(pending)
+    db.commit()
+    missing_id = uuid.uuid4()
+
+    def fake_cancel(db, video, cleanup_option):
+        return CancelResult(
+            video_id=video.id,
+            previous_status=video.status,
+            new_status="canceled",
+            celery_task_revoked=False,
+            cleanup_summary=ServiceCleanupSummary(),
+        )
+
+    with patch("app.api.routes.videos.cancel_video_processing", side_effect=fake_cancel) as mock_cancel:
+        response = client_with_user.post(
+            "/api/v1/videos/cancel-bulk",
+            json={
+                "video_ids": [str(missing_id), str(pending.id), str(sample_video.id)],
+                "cleanup_option": "keep_video",
+            },
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 3
+    assert data["canceled"] == 1
+    assert data["skipped"] == 2
+    assert [r["video_id"] for r in data["results"]] == [
+        str(missing_id),
+        str(pending.id),
+        str(sample_video.id),
+    ]
+    assert data["results"][0]["error"] == "Video not found"
+    assert data["results"][1]["success"] is True
+    assert data["results"][2]["previous_status"] == "completed"
+    mock_cancel.assert_called_once()
+
+
+def test_cancel_full_delete_removes_collection_links(client_with_user, db: Session, test_user):
+    """Full delete soft-deletes the video and drops its collection memberships."""
+    from app.models import Collection, CollectionVideo
+
+    video = Video(
+        user_id=test_user.id,
+        youtube_id="cancelme",
+        youtube_url="https://www.youtube.com/watch?v=cancelme",
+        title="Cancel Me",
+        status="downloading",
+    )
+    collection = Collection(user_id=test_user.id, name="Watch later")
+    db.add_all([video, collection])
+    db.flush()
+    db.add(CollectionVideo(collection_id=collection.id, video_id=video.id))
+    db.commit()
+
+    with patch("app.services.job_cancellation.vector_store_service"):
+        response = client_with_user.post(
+            f"/api/v1/videos/{video.id}/cancel",
+            json={"cleanup_option": "full_delete"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["new_status"] == "deleted"
+    assert db.query(CollectionVideo).filter(CollectionVideo.video_id == video.id).count() == 0
+    db.refresh(video)
+    assert video.is_deleted is True
+
+
+def test_cancel_invalid_cleanup_option_returns_422(client_with_user, sample_video):
+    """Unknown cleanup options are rejected at request validation."""
+    response = client_with_user.post(
+        f"/api/v1/videos/{sample_video.id}/cancel",
+        json={"cleanup_option": "shred"},
+    )
+
+    assert response.status_code == 422
+
+
+def test_cancel_bulk_normalizes_cleanup_option(client_with_user, sample_video):
+    """Cleanup option is matched case-insensitively."""
+    with patch("app.api.routes.videos.cancel_video_processing") as mock_cancel:
+        response = client_with_user.post(
+            "/api/v1/videos/cancel-bulk",
+            json={"video_ids": [str(sample_video.id)], "cleanup_option": " Full_Delete "},
+        )
+
+    assert response.status_code == 200
+    mock_cancel.assert_not_called()
+
+
 # Rate limiting test (verifies route setup)
 
 
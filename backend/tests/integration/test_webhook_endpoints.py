@@ -0,0 +1,373 @@
+"""
+Integration tests for webhook endpoints.
+
+Tests the full request/response cycle for:
+- POST /webhooks/stripe
+- POST /webhooks/stripe/batch
+"""
+import hashlib
+import hmac
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from stripe.stripe_object import StripeObject
+
+from app.core.config import get_settings, settings
+from app.core.nextauth import get_current_user
+from app.main import app
+
+WEBHOOK_SECRET = "whsec_test_secret"
+
+
+def _sign(payload: str, secret: str = WEBHOOK_SECRET, timestamp: int = None) -> str:
+    """Build a stripe-signature header for the payload."""
+    timestamp = timestamp or int(time.time())
+    signature = hmac.new(
+        secret.encode(), f"{timestamp}.{payload}".encode(), hashlib.sha256
+    ).hexdigest()
+    return f"t={timestamp},v1={signature}"
+
+
+def _event_payload(event_type: str = "customer.subscription.updated") -> str:
+    return json.dumps(
+        {
+            "id": "evt_test",
+            "object": "event",
+            "type": event_type,
+            "data": {
+                "object": {
+                    "id": "sub_123",
+                    "object": "subscription",
+                    "status": "active",
+                }
+            },
+        }
+    )
+
+
+def _override_settings(**values):
+    app.dependency_overrides[get_settings] = lambda: settings.model_copy(update=values)
+
+
+@pytest.fixture
+def client():
+    _override_settings(stripe_webhook_secret=WEBHOOK_SECRET)
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def mock_process_event():
+    with patch("app.api.routes.webhooks.process_stripe_event") as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def fake_redis():
+    """In-memory stand-in for the dedup keys kept in Redis."""
+    claimed = set()
+
+    def claim(event_id):
+        if event_id in claimed:
+            return False
+        claimed.add(event_id)
+        return True
+
+    with patch("app.api.routes.webhooks.claim_stripe_event", side_effect=claim), patch(
+        "app.api.routes.webhooks.release_stripe_event", side_effect=claimed.discard
+    ):
+        yield claimed
+
+
+class TestStripeWebhook:
+    """Tests for POST /webhooks/stripe."""
+
+    def test_valid_event_is_queued(self, client, mock_process_event):
+        """A verified event is handed to the webhooks queue and acknowledged."""
+        payload = _event_payload()
+
+        response = client.post(
+            "/api/v1/webhooks/stripe",
+            content=payload,
+            headers={"stripe-signature": _sign(payload)},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+        mock_process_event.apply_async.assert_called_once()
+        call = mock_process_event.apply_async.call_args
+        assert call.kwargs["queue"] == "webhooks"
+        event_type, event_data = call.kwargs["args"]
+        assert event_type == "customer.subscription.updated"
+        assert event_data == {
+            "id": "sub_123",
+            "object": "subscription",
+            "status": "active",
+        }
+        # Plain dict, not a StripeObject proxy
+        assert not isinstance(event_data, StripeObject)
+        assert call.kwargs["kwargs"] == {"event_id": "evt_test"}
+
+    def test_invalid_signature_rejected(self, client, mock_process_event):
+        """Events signed with another secret are rejected and not queued."""
+        payload = _event_payload()
+
+        response = client.post(
+            "/api/v1/webhooks/stripe",
+            content=payload,
+            headers={"stripe-signature": _sign(payload, secret="whsec_other")},
+        )
+
+        assert response.status_code == 400
+        mock_process_event.apply_async.assert_not_called()
+
+    def test_stale_signature_rejected(self, client, mock_process_event):
+        """Correctly signed but replayed (old) deliveries are rejected."""
+        payload = _event_payload()
+
+        response = client.post(
+            "/api/v1/webhooks/stripe",
+            content=payload,
+            headers={
+                "stripe-signature": _sign(payload, timestamp=int(time.time()) - 600)
+            },
+        )
+
+        assert response.status_code == 400
+        mock_process_event.apply_async.assert_not_called()
+
+    def test_malformed_payload_rejected(self, client, mock_process_event):
+        """A signed body that is not a Stripe event is rejected."""
+        payload = json.dumps({"id": "evt_test"})
+
+        response = client.post(
+            "/api/v1/webhooks/stripe",
+            content=payload,
+            headers={"stripe-signature": _sign(payload)},
+        )
+
+        assert response.status_code == 400
+        mock_process_event.apply_async.assert_not_called()
+
+    def test_secondary_secret_accepted(self, client, mock_process_event):
+        """Events signed with any configured secret are accepted."""
+        payload = _event_payload()
+
+        _override_settings(
+            stripe_webhook_secret=WEBHOOK_SECRET,
+            stripe_webhook_secrets=["whsec_connect"],
+        )
+        response = client.post(
+            "/api/v1/webhooks/stripe",
+            content=payload,
+            headers={"stripe-signature": _sign(payload, secret="whsec_connect")},
+        )
+
+        assert response.status_code == 200
+        mock_process_event.apply_async.assert_called_once()
+
+    def test_missing_signature_rejected(self, client, mock_process_event):
+        """Requests without a stripe-signature header are rejected."""
+        response = client.post("/api/v1/webhooks/stripe", content=_event_payload())
+
+        assert response.status_code == 400
+        mock_process_event.apply_async.assert_not_called()
+
+    def test_unconfigured_secret_returns_503(self, client, mock_process_event):
+        """Without any signing secret the endpoint refuses to process events."""
+        _override_settings(stripe_webhook_secret="", stripe_webhook_secrets=[])
+        payload = _event_payload()
+
+        response = client.post(
+            "/api/v1/webhooks/stripe",
+            content=payload,
+            headers={"stripe-signature": _sign(payload)},
+        )
+
+        assert response.status_code == 503
+        mock_process_event.apply_async.assert_not_called()
+
+    def test_enqueue_failure_returns_500(self, client, mock_process_event, fake_redis):
+        """If the broker is down, Stripe gets a 500 so it retries delivery."""
+        mock_process_event.apply_async.side_effect = ConnectionError("broker down")
+        payload = _event_payload()
+
+        response = client.post(
+            "/api/v1/webhooks/stripe",
+            content=payload,
+            headers={"stripe-signature": _sign(payload)},
+        )
+
+        assert response.status_code == 500
+        # The claim is released so the retried delivery is not deduplicated
+        assert "evt_test" not in fake_redis
+
+    def test_duplicate_delivery_queued_once(self, client, mock_process_event):
+        """A redelivered event ID is acknowledged without being queued again."""
+        payload = _event_payload()
+
+        for _ in range(2):
+            response = client.post(
+                "/api/v1/webhooks/stripe",
+                content=payload,
+                headers={"stripe-signature": _sign(payload)},
+            )
+            assert response.status_code == 200
+
+        assert response.json() == {"status": "ok", "dedup": True}
+        mock_process_event.apply_async.assert_called_once()
+
+
+@pytest.fixture
+def admin_client(admin_user):
+    app.dependency_overrides[get_current_user] = lambda: admin_user
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def non_admin_client(free_user):
+    app.dependency_overrides[get_current_user] = lambda: free_user
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _stripe_event(
+    event_id: str, event_type: str, created: int = 1700000000, **obj_fields
+) -> dict:
+    return {
+        "id": event_id,
+        "type": event_type,
+        "created": created,
+        "data": {"object": {"id": f"obj_{event_id}", **obj_fields}},
+    }
+
+
+class TestStripeEventBatch:
+    """Tests for POST /webhooks/stripe/batch."""
+
+    def test_batch_processes_each_event_once(self, admin_client):
+        """Events are fetched from Stripe, applied, and duplicates skipped."""
+        with patch(
+            "app.api.routes.webhooks.stripe.Event.retrieve"
+        ) as mock_retrieve, patch(
+            "app.api.routes.webhooks.handle_stripe_event"
+        ) as mock_handle:
+            mock_retrieve.side_effect = lambda event_id: _stripe_event(
+                event_id, "customer.subscription.updated"
+            )
+
+            response = admin_client.post(
+                "/api/v1/webhooks/stripe/batch",
+                json={"event_ids": ["evt_1", "evt_2", "evt_1"]},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["processed"] == 2
+        assert data["failed"] == 0
+        assert [r["event_id"] for r in data["results"]] == ["evt_1", "evt_2"]
+        assert mock_handle.call_count == 2
+
+    def test_batch_applies_customer_events_in_created_order(self, admin_client):
+        """A stale subscription.updated is applied before the later deletion."""
+        events = {
+            "evt_deleted": _stripe_event(
+                "evt_deleted",
+                "customer.subscription.deleted",
+                created=200,
+                customer="cus_1",
+            ),
+            "evt_updated": _stripe_event(
+                "evt_updated",
+                "customer.subscription.updated",
+                created=100,
+                customer="cus_1",
+            ),
+        }
+        applied = []
+
+        with patch(
+            "app.api.routes.webhooks.stripe.Event.retrieve", side_effect=events.get
+        ), patch(
+            "app.api.routes.webhooks.handle_stripe_event",
+            side_effect=lambda event_type, _data: applied.append(event_type),
+        ):
+            response = admin_client.post(
+                "/api/v1/webhooks/stripe/batch",
+                json={"event_ids": ["evt_deleted", "evt_updated"]},
+            )
+
+        assert response.status_code == 200
+        assert response.json()["processed"] == 2
+        assert applied == [
+            "customer.subscription.updated",
+            "customer.subscription.deleted",
+        ]
+
+    def test_batch_skips_already_claimed_events(self, admin_client, fake_redis):
+        """Events the webhook path already processed are reported as dedup."""
+        fake_redis.add("evt_seen")
+
+        with patch(
+            "app.api.routes.webhooks.stripe.Event.retrieve"
+        ) as mock_retrieve, patch(
+            "app.api.routes.webhooks.handle_stripe_event"
+        ) as mock_handle:
+            mock_retrieve.side_effect = lambda event_id: _stripe_event(
+                event_id, "checkout.session.completed"
+            )
+
+            response = admin_client.post(
+                "/api/v1/webhooks/stripe/batch",
+                json={"event_ids": ["evt_seen", "evt_new"]},
+            )
+
+        data = response.json()
+        assert data["processed"] == 1
+        assert data["skipped"] == 1
+        assert data["results"][0]["dedup"] is True
+        mock_handle.assert_called_once()
+        # Replayed events are claimed so a later redelivery is not applied again
+        assert "evt_new" in fake_redis
+
+    def test_batch_reports_failures_without_stopping(self, admin_client, fake_redis):
+        """One failing event is reported while the others still succeed."""
+
+        def fake_handle(event_type, event_data):
+            if event_data["id"] == "obj_evt_bad":
+                raise KeyError("metadata")
+
+        with patch(
+            "app.api.routes.webhooks.stripe.Event.retrieve"
+        ) as mock_retrieve, patch(
+            "app.api.routes.webhooks.handle_stripe_event", side_effect=fake_handle
+        ):
+            mock_retrieve.side_effect = lambda event_id: _stripe_event(
+                event_id, "checkout.session.completed"
+            )
+
+            response = admin_client.post(
+                "/api/v1/webhooks/stripe/batch",
+                json={"event_ids": ["evt_ok", "evt_bad"]},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["processed"] == 1
+        assert data["failed"] == 1
+        assert data["results"][1]["success"] is False
+        # The failed event's claim is released so it can be retried
+        assert "evt_bad" not in fake_redis
+
+    def test_batch_requires_admin(self, non_admin_client):
+        """Non-admin users cannot replay events."""
+        response = non_admin_client.post(
+            "/api/v1/webhooks/stripe/batch",
+            json={"event_ids": ["evt_1"]},
+        )
+
+        assert response.status_code == 403
@@ -217,6 +217,17 @@ class TestEnvironmentConfiguration:
         assert hasattr(settings, "environment"), "Settings should have environment attribute"
         assert settings.environment in ["development", "staging", "production"]
 
+    def test_comma_separated_list_env_vars(self, monkeypatch):
+        """Verify list settings accept comma-separated env values."""
+        from app.core.config import Settings
+
+        monkeypatch.setenv("ADMIN_EMAILS", "a@test.com, b@test.com")
+        monkeypatch.setenv("BACKEND_CORS_ORIGINS", "https://app.test,https://www.app.test")
+
+        test_settings = Settings()
+        assert test_settings.admin_emails == ["a@test.com", "b@test.com"]
+        assert test_settings.backend_cors_origins == ["https://app.test", "https://www.app.test"]
+
 
 # Run all tests
 if __name__ == "__main__":
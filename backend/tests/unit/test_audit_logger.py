@@ -0,0 +1,24 @@
+"""
+Unit tests for audit log IP hashing.
+"""
+import hashlib
+
+from app.models import AdminAuditLog
+from app.services.audit_logger import _hash_ip
+
+
+def test_ip_hash_is_raw_digest():
+    assert _hash_ip(None) is None
+    assert _hash_ip("203.0.113.7") == hashlib.sha256(b"203.0.113.7").digest()
+    assert len(_hash_ip("203.0.113.7")) == 32
+
+
+def test_ip_hash_round_trips(db, free_user):
+    log = AdminAuditLog(
+        event_type="chat_message", user_id=free_user.id, ip_hash=_hash_ip("203.0.113.7")
+    )
+    db.add(log)
+    db.commit()
+    db.expire(log)
+
+    assert log.ip_hash.hex() == hashlib.sha256(b"203.0.113.7").hexdigest()
@@ -0,0 +1,19 @@
+"""
+Unit tests for Chunk model helpers.
+"""
+import pytest
+
+from app.models import Chunk
+
+
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [
+        (0.0, 10.4, "00:00 - 00:10"),
+        (65.9, 125.2, "01:05 - 02:05"),
+        (3540.0, 3665.0, "59:00 - 61:05"),
+        (3725.5, 7322.0, "01:02:05 - 02:02:02"),
+    ],
+)
+def test_timestamp_display(start, end, expected):
+    assert Chunk(start_timestamp=start, end_timestamp=end).timestamp_display == expected
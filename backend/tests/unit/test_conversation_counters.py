@@ -0,0 +1,26 @@
+"""
+Conversation counters are maintained by a single UPDATE per chat turn.
+"""
+from app.api.routes.conversations import _record_conversation_turn
+from app.models import Conversation, Message
+
+
+def test_record_turn_counts_pending_messages(db, free_user):
+    conversation = Conversation(user_id=free_user.id, title="Chat", total_tokens_used=5)
+    db.add(conversation)
+    db.commit()
+
+    db.add(Message(conversation_id=conversation.id, role="user", content="hi"))
+    reply = Message(
+        conversation_id=conversation.id,
+        role="assistant",
+        content="hello",
+        token_count=7,
+    )
+    db.add(reply)
+    _record_conversation_turn(db, conversation.id, reply, token_count=7)
+    db.commit()
+
+    assert conversation.message_count == 2
+    assert conversation.total_tokens_used == 12
+    assert conversation.last_message_at == reply.created_at
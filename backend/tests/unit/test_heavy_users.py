@@ -0,0 +1,76 @@
+"""
+Unit tests for heavy-user detection (cleanup_tasks._find_heavy_users).
+"""
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.models import UserQuota
+from app.models.usage import UsageEvent
+from app.tasks.cleanup_tasks import _find_heavy_users
+
+
+def _add_events(db, user, event_type, count, days_ago=1):
+    timestamp = datetime.utcnow() - timedelta(days=days_ago)
+    for _ in range(count):
+        db.add(
+            UsageEvent(
+                user_id=user.id,
+                event_type=event_type,
+                event_metadata={},
+                event_timestamp=timestamp,
+            )
+        )
+    db.commit()
+
+
+def _add_quota(db, user, storage_mb):
+    now = datetime.utcnow()
+    db.add(
+        UserQuota(
+            user_id=user.id,
+            quota_period_start=now,
+            quota_period_end=now + timedelta(days=30),
+            videos_limit=999999,
+            minutes_limit=Decimal(999999),
+            messages_limit=999999,
+            storage_mb_used=Decimal(storage_mb),
+            storage_mb_limit=Decimal(50000),
+        )
+    )
+    db.commit()
+
+
+class TestFindHeavyUsers:
+    """Test threshold checks over batched usage counts."""
+
+    @pytest.mark.usefixtures("free_user")
+    def test_no_paid_users(self, db):
+        assert _find_heavy_users(db) == {"users_checked": 0, "heavy_users": []}
+
+    def test_breaches_reported_per_user(self, db, pro_user, free_user):
+        _add_events(db, pro_user, "video_ingested", 201)
+        _add_events(db, pro_user, "chat_message_sent", 5)
+        # Old events fall outside the 30-day window
+        _add_events(db, pro_user, "chat_message_sent", 2001, days_ago=40)
+        _add_quota(db, pro_user, storage_mb=45 * 1024)
+        # Free users are never checked
+        _add_events(db, free_user, "video_ingested", 300)
+
+        result = _find_heavy_users(db)
+
+        assert result["users_checked"] == 1
+        [heavy] = result["heavy_users"]
+        assert heavy["user_id"] == str(pro_user.id)
+        assert heavy["videos_30d"] == 201
+        assert heavy["messages_30d"] == 5
+        assert heavy["storage_gb"] == 45.0
+        assert len(heavy["breaches"]) == 2
+
+    def test_user_under_thresholds_not_flagged(self, db, pro_user):
+        _add_events(db, pro_user, "chat_message_sent", 3)
+
+        result = _find_heavy_users(db)
+
+        assert result == {"users_checked": 1, "heavy_users": []}
@@ -0,0 +1,34 @@
+"""
+List endpoints load only columns; relationship access must be explicit.
+"""
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+
+from app.api.routes.collections import list_collections
+from app.models import Collection
+
+
+@pytest.mark.asyncio
+async def test_list_collections_under_raiseload(db, free_user):
+    """Collection list builds summaries without touching relationships."""
+    collection = Collection(user_id=free_user.id, name="Lectures")
+    db.add(collection)
+    db.commit()
+    db.expunge(collection)
+
+    loaded = []
+
+    def _capture(target, _context):
+        loaded.append(target)
+
+    event.listen(Collection, "load", _capture)
+    try:
+        result = await list_collections(skip=0, limit=50, db=db, current_user=free_user)
+    finally:
+        event.remove(Collection, "load", _capture)
+
+    assert result.total == 1
+    assert result.collections[0].name == "Lectures"
+    with pytest.raises(InvalidRequestError):
+        _ = loaded[0].collection_videos
@@ -0,0 +1,221 @@
+"""
+Unit tests for NextAuth.js JWT verification.
+"""
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import jwt
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.core.config import settings
+from app.core.nextauth import (
+    get_current_user,
+    invalidate_user_cache,
+    verify_nextauth_token,
+)
+
+
+def _token(secret: str, **overrides) -> str:
+    claims = {
+        "sub": "oauth_123",
+        "email": "user@test.com",
+        "exp": int(time.time()) + 300,
+    }
+    claims.update(overrides)
+    return jwt.encode(claims, secret, algorithm="HS256")
+
+
+@pytest.fixture
+def secrets():
+    with patch("app.core.nextauth.settings.nextauth_secret", "current-secret"), patch(
+        "app.core.nextauth.settings.nextauth_previous_secret", "old-secret"
+    ):
+        yield
+
+
+@pytest.mark.usefixtures("secrets")
+class TestVerifyNextauthToken:
+    """Test token verification and secret rotation."""
+
+    def test_current_secret_accepted(self):
+        claims = verify_nextauth_token(_token("current-secret"))
+        assert claims["email"] == "user@test.com"
+
+    def test_previous_secret_accepted_during_rotation(self):
+        claims = verify_nextauth_token(_token("old-secret"))
+        assert claims["sub"] == "oauth_123"
+
+    def test_unknown_secret_rejected(self):
+        with pytest.raises(HTTPException) as exc_info:
+            verify_nextauth_token(_token("someone-else"))
+        assert exc_info.value.status_code == 401
+
+    def test_expired_token_not_retried_with_previous_secret(self):
+        expired = _token("current-secret", exp=int(time.time()) - 10)
+        with pytest.raises(HTTPException) as exc_info:
+            verify_nextauth_token(expired)
+        assert exc_info.value.status_code == 401
+
+    @pytest.mark.parametrize(
+        "token", ["not-a-jwt", "a.b.c.d", "a." + "x" * 9000 + ".c"]
+    )
+    def test_malformed_token_rejected_without_decoding(self, token):
+        with patch("app.core.nextauth.jwt.decode") as mock_decode, pytest.raises(
+            HTTPException
+        ) as exc_info:
+            verify_nextauth_token(token)
+        assert exc_info.value.status_code == 401
+        mock_decode.assert_not_called()
+
+    def test_previous_secret_ignored_when_unset(self):
+        with patch(
+            "app.core.nextauth.settings.nextauth_previous_secret", None
+        ), pytest.raises(HTTPException):
+            verify_nextauth_token(_token("old-secret"))
+
+
+@pytest.mark.usefixtures("secrets")
+class TestTokenClaimsCache:
+    """Test the per-process verified-claims cache."""
+
+    def test_repeat_token_skips_decode(self):
+        token = _token("current-secret", sub="cache_hit")
+        first = verify_nextauth_token(token)
+
+        with patch("app.core.nextauth.jwt.decode") as mock_decode:
+            second = verify_nextauth_token(token)
+
+        mock_decode.assert_not_called()
+        assert second == first
+
+    def test_expired_entry_is_not_served(self):
+        token = _token("current-secret", sub="cache_exp", exp=int(time.time()) + 2)
+        verify_nextauth_token(token)
+
+        with patch("app.core.nextauth.time.time", return_value=time.time() + 5), patch(
+            "app.core.nextauth.jwt.decode", wraps=jwt.decode
+        ) as mock_decode:
+            verify_nextauth_token(token)
+
+        # Past the token's exp the cache misses and the token is re-verified
+        mock_decode.assert_called_once()
+
+    def test_removed_previous_secret_not_served_from_cache(self):
+        token = _token("old-secret", sub="cache_rotation")
+        verify_nextauth_token(token)
+
+        with patch(
+            "app.core.nextauth.settings.nextauth_previous_secret", None
+        ), pytest.raises(HTTPException):
+            verify_nextauth_token(token)
+
+
+def _credentials(email: str = "user@test.com") -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=_token("current-secret", email=email)
+    )
+
+
+@pytest.fixture
+def clean_user_cache():
+    invalidate_user_cache()
+    yield
+    invalidate_user_cache()
+
+
+@pytest.mark.usefixtures("secrets", "clean_user_cache")
+class TestGetCurrentUserCache:
+    """Test the per-process resolved-user cache."""
+
+    def test_repeat_request_skips_login_write(self, db):
+        """Within the TTL, the user is reloaded by ID without re-syncing the profile."""
+        first = get_current_user(_credentials(), db, settings)
+        first_login = first.last_login_at
+
+        with patch.object(db, "commit") as mock_commit:
+            second = get_current_user(_credentials(), db, settings)
+
+        assert second.id == first.id
+        assert second.last_login_at == first_login
+        mock_commit.assert_not_called()
+
+    def test_deactivated_user_rejected_on_cache_hit(self, db):
+        """Cached identities still see is_active changes immediately."""
+        user = get_current_user(_credentials(), db, settings)
+        user.is_active = False
+        db.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user(_credentials(), db, settings)
+        assert exc_info.value.status_code == 403
+
+    def test_deleted_user_falls_back_to_lookup(self, db):
+        """A stale cached ID is dropped and the user is resolved again."""
+        user = get_current_user(_credentials(), db, settings)
+        db.delete(user)
+        db.commit()
+
+        recreated = get_current_user(_credentials(), db, settings)
+
+        assert recreated.email == "user@test.com"
+        assert recreated.id != user.id
+
+
+@pytest.mark.usefixtures("secrets", "clean_user_cache")
+class TestLastLoginDebounce:
+    """Test that returning users only trigger a write when something changed."""
+
+    def test_recent_login_does_not_commit(self, db):
+        user = get_current_user(_credentials(), db, settings)
+        invalidate_user_cache()
+
+        with patch.object(db, "commit") as mock_commit:
+            get_current_user(_credentials(), db, settings)
+
+        mock_commit.assert_not_called()
+        assert user.last_login_at is not None
+
+    def test_stale_login_is_refreshed(self, db):
+        user = get_current_user(_credentials(), db, settings)
+        user.last_login_at = datetime.utcnow() - timedelta(hours=1)
+        db.commit()
+        invalidate_user_cache()
+
+        refreshed = get_current_user(_credentials(), db, settings)
+
+        assert datetime.utcnow() - refreshed.last_login_at < timedelta(minutes=1)
+
+
+@pytest.mark.usefixtures("secrets", "clean_user_cache")
+class TestConcurrentFirstLogin:
+    """Test the lazy-create race between two first requests."""
+
+    def test_duplicate_insert_falls_back_to_existing_row(self, db):
+        from app.models import User
+
+        existing = User(
+            oauth_provider="google",
+            oauth_provider_id="oauth_123",
+            email="race@test.com",
+            subscription_tier="free",
+            is_active=True,
+        )
+        db.add(existing)
+        db.commit()
+
+        # Simulate the other request winning: our initial lookup misses
+        real_query = db.query
+        first_lookup = MagicMock()
+        first_lookup.filter.return_value.first.return_value = None
+        lookups = iter([first_lookup])
+
+        def query(*args, **kwargs):
+            return next(lookups, None) or real_query(*args, **kwargs)
+
+        with patch.object(db, "query", side_effect=query):
+            user = get_current_user(_credentials(email="race@test.com"), db, settings)
+
+        assert user.id == existing.id
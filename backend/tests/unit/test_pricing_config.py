@@ -11,8 +11,12 @@ from app.core.pricing import (
     is_unlimited,
     check_limit_exceeded,
     get_usage_percentage,
+    get_model_for_tier,
+    get_model_info_for_tier,
+    resolve_model,
     PRICING_TIERS,
 )
+from app.core.config import settings
 
 
 class TestPricingConfiguration:
@@ -101,6 +105,55 @@ class TestQuotaLimitsHelper:
         assert limits["storage_limit_mb"] == 50000
         assert limits["minutes_limit"] == -1
 
+    def test_get_quota_limits_is_read_only(self):
+        """Returned limits are shared, so they cannot be modified."""
+        limits = get_quota_limits("free")
+        with pytest.raises(TypeError):
+            limits["video_limit"] = 999
+        assert get_quota_limits("free")["video_limit"] == 10
+
+    def test_get_quota_limits_invalid_tier(self):
+        """Unknown tiers raise ValueError."""
+        with pytest.raises(ValueError):
+            get_quota_limits("invalid_tier")
+
+
+class TestModelForTier:
+    """Test tier -> model resolution."""
+
+    def test_tier_models(self):
+        assert get_model_for_tier("free") == settings.llm_model_free
+        assert get_model_for_tier("pro") == settings.llm_model_pro
+
+    def test_unknown_tier_falls_back_to_free(self):
+        assert get_model_for_tier("unknown") == get_model_for_tier("free")
+
+    def test_resolve_model_defaults_to_tier_model(self):
+        assert resolve_model("pro") == get_model_for_tier("pro")
+        assert resolve_model("pro", "deepseek-chat") == "deepseek-chat"
+
+
+class TestReadOnlyTierData:
+    """Shared tier data is handed out as read-only views."""
+
+    def test_tier_config_is_read_only(self):
+        config = get_tier_config("pro")
+        with pytest.raises(TypeError):
+            config["video_limit"] = 5
+        assert config["video_limit"] == PRICING_TIERS["pro"]["video_limit"]
+
+    def test_tier_tables_are_read_only(self):
+        with pytest.raises(TypeError):
+            PRICING_TIERS["vip"] = {}
+        with pytest.raises(TypeError):
+            get_model_info_for_tier("pro")["specs"]["context_length"] = 1
+
+    def test_model_info_unknown_tier_falls_back_to_free(self):
+        assert (
+            get_model_info_for_tier("unknown")["model_id"]
+            == get_model_info_for_tier("free")["model_id"]
+        )
+
 
 class TestIsUnlimitedHelper:
     """Test is_unlimited helper function."""
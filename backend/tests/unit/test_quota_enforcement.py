@@ -8,6 +8,7 @@ from unittest.mock import patch, MagicMock
 from fastapi import HTTPException
 
 from app.core.quota import (
+    check_quotas,
     check_video_quota,
     check_message_quota,
     check_storage_quota,
@@ -15,6 +16,7 @@ from app.core.quota import (
     QuotaExceededException,
 )
 from app.schemas import QuotaUsage
+from app.services.subscription import subscription_service
 
 
 class TestVideoQuotaCheck:
@@ -282,6 +284,73 @@ class TestMinutesQuotaCheck:
         await check_minutes_quota(admin_user, 10000, db)
 
 
+class TestQuotaFetchedOnce:
+    """Back-to-back checks share one quota computation per session."""
+
+    @pytest.mark.asyncio
+    async def test_ingest_checks_fetch_quota_once(self, db, free_user):
+        """Video, minutes and storage checks reuse the same usage snapshot."""
+        with patch(
+            "app.core.quota.subscription_service.get_user_quota",
+            wraps=subscription_service.get_user_quota,
+        ) as mock_quota:
+            await check_video_quota(free_user, db)
+            await check_minutes_quota(free_user, 30, db)
+            await check_storage_quota(free_user, 1, db)
+
+        assert mock_quota.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_check_quotas_raises_first_exceeded(self, db, free_user):
+        """Batched check fetches once and reports the first failing quota."""
+        with patch("app.core.quota.subscription_service.get_user_quota") as mock_quota:
+            mock_quota.return_value = QuotaUsage(
+                tier="free",
+                videos_used=5,
+                videos_limit=10,
+                videos_remaining=5,
+                documents_used=0,
+                documents_limit=5,
+                documents_remaining=5,
+                messages_used=50,
+                messages_limit=200,
+                messages_remaining=150,
+                storage_used_mb=950,
+                storage_limit_mb=1000,
+                storage_remaining_mb=50,
+                minutes_used=990,
+                minutes_limit=1000,
+                minutes_remaining=10,
+            )
+
+            with pytest.raises(QuotaExceededException) as exc:
+                await check_quotas(free_user, db, video=True, minutes=5, storage_mb=100)
+
+        assert exc.value.detail["quota_type"] == "storage"
+        assert mock_quota.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_check_quotas_admin_bypass(self, db, admin_user):
+        """Admins skip the batched check without computing usage."""
+        with patch("app.core.quota.subscription_service.get_user_quota") as mock_quota:
+            await check_quotas(admin_user, db, video=True, minutes=10000, storage_mb=1e6)
+
+        mock_quota.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_commit_invalidates_cached_quota(self, db, free_user):
+        """Writes committed between checks are seen by the next check."""
+        with patch(
+            "app.core.quota.subscription_service.get_user_quota",
+            wraps=subscription_service.get_user_quota,
+        ) as mock_quota:
+            await check_video_quota(free_user, db)
+            db.commit()
+            await check_video_quota(free_user, db)
+
+        assert mock_quota.call_count == 2
+
+
 class TestQuotaExceededException:
     """Test QuotaExceededException structure."""
 
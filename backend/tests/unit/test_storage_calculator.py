@@ -309,3 +309,79 @@ class TestStorageCalculationAccuracy:
 
         # Verify filter was called multiple times for different tables
         assert mock_query.filter.call_count >= 1
+
+
+class TestRefreshVideoStorageBytes:
+    """Test persisted per-video storage sizes."""
+
+    def test_prefers_transcript_file_size(self, tmp_path):
+        """Transcript size comes from the file on disk when present."""
+        from app.services.storage_calculator import refresh_video_storage_bytes
+
+        transcript_file = tmp_path / "transcript.json"
+        transcript_file.write_bytes(b"x" * 2048)
+        video = MagicMock(transcript_file_path=str(transcript_file))
+
+        mock_db = MagicMock()
+        mock_query = MagicMock()
+        mock_query.filter.return_value = mock_query
+        mock_query.scalar.return_value = 4096
+        mock_db.query.return_value = mock_query
+
+        refresh_video_storage_bytes(mock_db, video)
+
+        assert video.transcript_bytes == 2048
+        assert video.chunk_bytes == 4096
+
+    def test_falls_back_to_transcript_text(self):
+        """Transcript size falls back to the stored UTF-8 text length."""
+        from app.services.storage_calculator import refresh_video_storage_bytes
+
+        video = MagicMock(transcript_file_path=None)
+
+        mock_db = MagicMock()
+        mock_query = MagicMock()
+        mock_query.filter.return_value = mock_query
+        mock_query.scalar.side_effect = ["héllo", 0]
+        mock_db.query.return_value = mock_query
+
+        refresh_video_storage_bytes(mock_db, video)
+
+        assert video.transcript_bytes == len("héllo".encode("utf-8"))
+        assert video.chunk_bytes == 0
+
+    def test_chunk_bytes_use_precomputed_text_bytes(self, db, free_user):
+        """Chunk text_bytes is filled on insert and summed per video."""
+        from app.models import Chunk, Video
+        from app.services.storage_calculator import refresh_video_storage_bytes
+
+        video = Video(
+            user_id=free_user.id,
+            youtube_id="bytes1",
+            youtube_url="https://www.youtube.com/watch?v=bytes1",
+            title="Bytes",
+            status="completed",
+        )
+        db.add(video)
+        db.flush()
+        chunk = Chunk(
+            video_id=video.id,
+            user_id=free_user.id,
+            chunk_index=0,
+            text="héllo",
+            chunk_summary="sum",
+            embedding_text=None,
+            token_count=1,
+            start_timestamp=0.0,
+            end_timestamp=1.0,
+            duration_seconds=1.0,
+        )
+        db.add(chunk)
+        db.commit()
+
+        expected = len("héllo".encode("utf-8")) + len("sum")
+        assert chunk.text_bytes == expected
+
+        refresh_video_storage_bytes(db, video)
+
+        assert video.chunk_bytes == expected
@@ -0,0 +1,94 @@
+"""
+Unit tests for Stripe webhook background processing.
+"""
+from unittest.mock import patch
+
+import pytest
+from celery.exceptions import Retry
+
+from app.tasks.subscription_tasks import handle_stripe_event, process_stripe_event
+
+
+class TestHandleStripeEvent:
+    """Test event dispatch to the subscription service."""
+
+    @patch("app.tasks.subscription_tasks.SessionLocal")
+    @patch("app.tasks.subscription_tasks.subscription_service")
+    def test_subscription_updated_dispatched(self, mock_service, mock_session_local):
+        """subscription.updated events go to handle_subscription_updated."""
+        data = {"id": "sub_123", "status": "past_due"}
+
+        handle_stripe_event("customer.subscription.updated", data)
+
+        db = mock_session_local.return_value.__enter__.return_value
+        mock_service.handle_subscription_updated.assert_called_once_with(data, db)
+
+    @patch("app.tasks.subscription_tasks.SessionLocal")
+    @patch("app.tasks.subscription_tasks.subscription_service")
+    def test_unhandled_event_is_ignored(self, mock_service, mock_session_local):
+        """Unknown event types do not touch the subscription service."""
+        handle_stripe_event("charge.refunded", {"id": "ch_1"})
+
+        assert mock_service.method_calls == []
+        mock_session_local.assert_not_called()
+
+    @patch("app.tasks.subscription_tasks.SessionLocal")
+    def test_log_only_event_skips_db_session(self, mock_session_local):
+        """Log-only events (e.g. payment succeeded) never open a DB session."""
+        handle_stripe_event(
+            "invoice.payment_succeeded", {"id": "in_1", "subscription": "sub_1"}
+        )
+
+        mock_session_local.assert_not_called()
+
+
+class TestProcessStripeEvent:
+    """Test retry behaviour of the Celery task."""
+
+    @patch("app.tasks.subscription_tasks.handle_stripe_event")
+    def test_permanent_error_not_retried(self, mock_handle):
+        """Bad payload shapes are logged and dropped rather than retried."""
+        mock_handle.side_effect = KeyError("metadata")
+
+        result = process_stripe_event.apply(
+            args=["checkout.session.completed", {}]
+        ).get()
+
+        assert result["status"] == "failed"
+        assert mock_handle.call_count == 1
+
+    @patch("app.tasks.subscription_tasks.handle_stripe_event")
+    def test_transient_error_retried(self, mock_handle):
+        """Transient failures are retried via Celery."""
+        mock_handle.side_effect = ConnectionError("db down")
+
+        with patch.object(
+            process_stripe_event, "retry", side_effect=Retry()
+        ) as mock_retry, pytest.raises(Retry):
+            process_stripe_event.apply(
+                args=["invoice.payment_failed", {"id": "in_1"}], throw=True
+            ).get()
+
+        mock_retry.assert_called_once()
+
+    @patch("app.tasks.subscription_tasks.release_stripe_event")
+    @patch("app.tasks.subscription_tasks.handle_stripe_event")
+    def test_exhausted_retries_release_claim(self, mock_handle, mock_release):
+        """After the last retry the dedup claim is dropped for Stripe to redeliver."""
+        mock_handle.side_effect = ConnectionError("db down")
+
+        result = process_stripe_event.apply(
+            args=["invoice.payment_failed", {"id": "in_1"}],
+            kwargs={"event_id": "evt_1"},
+            retries=process_stripe_event.max_retries,
+        ).get()
+
+        assert result["status"] == "failed"
+        mock_release.assert_called_once_with("evt_1")
+
+    def test_uses_msgpack_serializer(self):
+        """Stripe payloads go over the broker as msgpack, which workers accept."""
+        from app.core.celery_app import celery_app
+
+        assert process_stripe_event.serializer == "msgpack"
+        assert "msgpack" in celery_app.conf.accept_content
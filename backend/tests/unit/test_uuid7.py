@@ -0,0 +1,32 @@
+"""
+Unit tests for time-ordered primary key generation (app.db.base.uuid7).
+"""
+import time
+from unittest.mock import patch
+
+from app.db.base import uuid7
+from app.models import Chunk, Job
+
+
+class TestUuid7:
+    """UUIDv7 keys are valid and sort by creation time."""
+
+    def test_version_and_variant(self):
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_ordered_across_milliseconds(self):
+        now_ns = time.time_ns()
+        with patch(
+            "app.db.base.time.time_ns", side_effect=[now_ns, now_ns + 2_000_000]
+        ):
+            first, second = uuid7(), uuid7()
+        assert first < second
+
+    def test_models_default_to_uuid7(self, db, free_user):
+        job = Job(user_id=free_user.id, job_type="download", status="pending")
+        db.add(job)
+        db.commit()
+        assert job.id.version == 7
+        assert Chunk.__table__.c.id.default.arg.__name__ == "uuid7"
@@ -1267,6 +1267,31 @@ class TestDeleteByVideoId:
         assert call_kwargs["collection_name"] == "my_collection"
 
 
+class TestDeleteByVideoIds:
+    def test_deletes_all_videos_in_one_call(self):
+        """Batch delete issues a single MatchAny filter request."""
+        vs = QdrantVectorStore(host="localhost", port=6333, collection_name="test")
+        mock_client = MagicMock()
+        vs.client = mock_client
+
+        vids = [uuid.uuid4(), uuid.uuid4()]
+        vs.delete_by_video_ids(vids)
+
+        mock_client.delete.assert_called_once()
+        selector = mock_client.delete.call_args.kwargs["points_selector"]
+        assert selector.must[0].key == "video_id"
+        assert selector.must[0].match.any == [str(v) for v in vids]
+
+    def test_empty_list_skips_request(self):
+        vs = QdrantVectorStore(host="localhost", port=6333, collection_name="test")
+        mock_client = MagicMock()
+        vs.client = mock_client
+
+        vs.delete_by_video_ids([])
+
+        mock_client.delete.assert_not_called()
+
+
 # ── Get Stats Tests ───────────────────────────────────────────────────────
 
 
@@ -1493,6 +1518,14 @@ class TestVectorStoreService:
 
         mock_store.delete_by_video_id.assert_called_once_with(vid)
 
+    def test_delete_videos(self):
+        mock_store = MagicMock()
+        service = VectorStoreService(vector_store=mock_store)
+        vids = [uuid.uuid4(), uuid.uuid4()]
+        service.delete_videos(vids)
+
+        mock_store.delete_by_video_ids.assert_called_once_with(vids)
+
     def test_get_stats(self):
         mock_store = MagicMock()
         mock_store.get_stats.return_value = {"total_points": 50}
@@ -384,6 +384,10 @@ class TestChunkAndEnrich:
         assert result["chunk_count"] == 1
         assert video.chunk_count == 1
         assert video.status == "chunked"
+        # Chunks are written in one executemany, not added one by one
+        db.add.assert_not_called()
+        [rows] = [c.args[1] for c in db.execute.call_args_list if len(c.args) > 1]
+        assert [r["chunk_title"] for r in rows] == ["Hello"]
         db.close.assert_called_once()
 
 
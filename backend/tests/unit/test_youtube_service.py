@@ -39,3 +39,48 @@ def test_extract_video_id_invalid_url_raises() -> None:
 
     with pytest.raises(YouTubeDownloadError):
         service.extract_video_id("https://example.com/not-a-youtube-link")
+
+
+def test_extract_video_id_with_v_not_first_param() -> None:
+    service = YouTubeService()
+
+    video_id = service.extract_video_id(
+        "https://www.youtube.com/watch?feature=share&v=VIDEO12345&t=30s"
+    )
+
+    assert video_id == "VIDEO12345"
+
+
+def test_get_video_info_cached_by_video_id(monkeypatch) -> None:
+    service = YouTubeService()
+    calls = []
+
+    def fake_fetch(normalized_url):
+        calls.append(normalized_url)
+        return {"youtube_id": "VIDEO12345", "title": "Cached", "chapters": []}
+
+    monkeypatch.setattr(service, "_fetch_video_info", fake_fetch)
+
+    first = service.get_video_info("https://www.youtube.com/watch?v=VIDEO12345&t=30s")
+    first["chapters"].append({"title": "mutated"})
+    second = service.get_video_info("https://youtu.be/VIDEO12345?si=abc")
+
+    assert calls == ["https://www.youtube.com/watch?v=VIDEO12345"]
+    assert second == {"youtube_id": "VIDEO12345", "title": "Cached", "chapters": []}
+
+
+def test_get_video_info_does_not_cache_failures(monkeypatch) -> None:
+    service = YouTubeService()
+    calls = []
+
+    def failing_fetch(normalized_url):
+        calls.append(normalized_url)
+        raise YouTubeDownloadError("boom")
+
+    monkeypatch.setattr(service, "_fetch_video_info", failing_fetch)
+
+    for _ in range(2):
+        with pytest.raises(YouTubeDownloadError):
+            service.get_video_info("https://youtu.be/VIDEO12345")
+
+    assert len(calls) == 2